@@ -0,0 +1,112 @@
+import contextlib
+import hashlib
+import marshal
+import os
+import sys
+from importlib.metadata import PackageNotFoundError, version
+from importlib.util import MAGIC_NUMBER
+from pathlib import Path
+from types import CodeType
+
+# =====================================================================
+# Things worth saving between runs, so a fresh process starts warm. The
+# Jinja bytecode cache lives here (see `templating`), as do the code
+# objects compiled from generated mapper source (see `compiler`). Every
+# entry is keyed on what it was built from and with, so a change to
+# either just means a miss, never a stale artifact, and anything in the
+# cache directory can be deleted at any time. A cache that can't be
+# written to is ignored.
+# =====================================================================
+
+# Most code objects kept per interpreter; the least recently used go.
+MAX_CODE_ENTRIES = 256
+
+
+def cache_dir(*parts: str) -> Path:
+    """Where the package keeps things worth saving between runs, under the
+    user cache directory. Override the root with the
+    `MAPPING_SANDBOX_CACHE_DIR` environment variable.
+
+    Args:
+        *parts (str): subdirectory within the cache root
+
+    Returns:
+        Path: the directory, which may not exist yet
+    """
+    root = os.environ.get("MAPPING_SANDBOX_CACHE_DIR")
+    if root is None:
+        xdg = os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+        root = os.path.join(xdg, "mapping_sandbox")
+    return Path(root, *parts)
+
+
+def package_version(package: str) -> str:
+    """The installed version of a package, or "none" if it isn't.
+
+    Args:
+        package (str): distribution name, e.g. "pydantic"
+
+    Returns:
+        str: the version
+    """
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        return "none"
+
+
+def write_entry(path: Path, data: bytes) -> None:
+    """Write a cache entry. It's written under a name of this process's
+    own and renamed into place, so a concurrent reader or writer sees all
+    of it or none. A cache that can't be written to (read-only home, full
+    disk, a file where the directory should be) isn't an error.
+
+    Args:
+        path (Path): the entry, normally under `cache_dir`
+        data (bytes): its contents
+    """
+    with contextlib.suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        temporary.write_bytes(data)
+        temporary.replace(path)
+
+
+def _prune(directory: Path, keep: int) -> None:
+    # Hits touch their entry, so the oldest mtimes are the least recently
+    # used. A race with another process pruning just gives up this round.
+    with contextlib.suppress(OSError):
+        entries = sorted(directory.glob("*.marshal"), key=lambda e: e.stat().st_mtime)
+        for entry in entries[: max(0, len(entries) - keep)]:
+            entry.unlink(missing_ok=True)
+
+
+def compile_cached(source: str, filename: str) -> CodeType:
+    """`compile(source, filename, "exec")`, through an on-disk cache of
+    marshalled code objects. Entries are keyed on the source, the filename
+    and the interpreter's bytecode magic number, since marshalled code is
+    only readable by the Python version that wrote it. At most
+    `MAX_CODE_ENTRIES` are kept per interpreter.
+
+    Args:
+        source (str): Python source
+        filename (str): the filename to compile it under
+
+    Returns:
+        CodeType: the compiled module code
+    """
+    key = hashlib.sha256(
+        b"\0".join([MAGIC_NUMBER, filename.encode(), source.encode()])
+    ).hexdigest()
+    directory = cache_dir("code", sys.implementation.cache_tag or "none")
+    path = directory / f"{key}.marshal"
+    with contextlib.suppress(OSError, ValueError, EOFError, TypeError):
+        code = marshal.loads(path.read_bytes())
+        if isinstance(code, CodeType):
+            with contextlib.suppress(OSError):
+                os.utime(path)
+            return code
+    code = compile(source, filename, "exec")
+    write_entry(path, marshal.dumps(code))
+    _prune(directory, MAX_CODE_ENTRIES)
+    return code
@@ -1,17 +1,31 @@
 import sys
-from typing import Any, Callable
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Iterator, Mapping
 
 if sys.version_info >= (3, 10):
     from typing import TypeAlias
 else:
     from typing_extensions import TypeAlias
 
-# =====================================================================
-# The initial skeleton for the output data, provided for your
-# convenience. `base_output` should not be changed, so you'll need to
-# create a copy. Python's copy.deepcopy() should be helpful for that.
-# =====================================================================
-base_employee: dict[str, Any] = {
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mapping proxies and lists to
+    tuples, so that any attempt to mutate the result raises.
+
+    Args:
+        value (Any): a JSON-like value
+
+    Returns:
+        Any: a read-only view of the same data
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+_skeleton: dict[str, Any] = {
     "type": "namespace/employee",
     "attributes": {
         "ids": [{"value": {"type": [{"value": "hr_id"}]}}],
@@ -20,4 +34,57 @@ base_employee: dict[str, Any] = {
     "metadata": [{"type": "namespace/source/name"}],
 }
 
+
+class _FrozenSkeleton(Mapping[str, Any]):
+    # A read-only view that still deep-copies, into the same plain tree
+    # `new_employee()` builds, so `copy.deepcopy(base_employee)` works as
+    # it always has.
+
+    __slots__ = ("_view",)
+
+    def __init__(self, view: Mapping[str, Any]) -> None:
+        self._view = view
+
+    def __getitem__(self, key: str) -> Any:
+        return self._view[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._view)
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def __repr__(self) -> str:
+        return repr(self._view)
+
+    def __copy__(self) -> dict[str, Any]:
+        return dict(self._view)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[str, Any]:
+        return new_employee()
+
+
+# =====================================================================
+# The initial skeleton for the output data, provided for your
+# convenience. `base_employee` is a frozen view and can't be changed;
+# call `new_employee()` (or `copy.deepcopy(base_employee)`, which does
+# the same, only slower) to get a fresh, mutable copy to fill in.
+# =====================================================================
+base_employee: Mapping[str, Any] = _FrozenSkeleton(freeze(_skeleton))
+
+# The skeleton is a literal of plain constants, so its repr is valid
+# Python. Compiling that repr once gives a constructor that rebuilds the
+# whole tree from bytecode on each call, which is far cheaper than
+# copy.deepcopy() and its memo dict.
+new_employee: Callable[[], dict[str, Any]] = eval(f"lambda: {_skeleton!r}")
+new_employee.__name__ = new_employee.__qualname__ = "new_employee"
+new_employee.__doc__ = """Build a fresh, mutable copy of `base_employee`."""
+
+del _skeleton
+
 Mappable: TypeAlias = Callable[[dict[str, Any]], dict[str, Any]]
+
+# A batch mapper takes many inputs at once so that per-call setup (copying
+# the skeleton, loading templates, resolving generic models) is paid once
+# per batch instead of once per record.
+BatchMappable: TypeAlias = Callable[[Iterable[dict[str, Any]]], list[dict[str, Any]]]
@@ -0,0 +1,72 @@
+import argparse
+import json
+import sys
+from typing import Any, Optional
+
+from .. import registry
+from .runner import METRICS, compare, run
+from .workloads import WORKLOADS
+
+COLUMNS = [*METRICS, "peak_rss_kb"]
+
+
+def _print_results(data: dict[str, Any]) -> None:
+    widths = {c: max(20, len(c) + 2) for c in COLUMNS}
+    header = f"{'mapper':<20}{'workload':<10}" + "".join(
+        f"{c:>{widths[c]}}" for c in COLUMNS
+    )
+    print(header)
+    for name, workloads in data["results"].items():
+        for workload, metrics in workloads.items():
+            cells = "".join(f"{metrics[c]:>{widths[c]},.2f}" for c in COLUMNS)
+            print(f"{name:<20}{workload:<10}{cells}")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m mapping_sandbox.bench",
+        description="Benchmark the registered mappers.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("-m", "--mapper", action="append", choices=registry.names())
+    run_parser.add_argument(
+        "-w", "--workload", action="append", choices=sorted(WORKLOADS)
+    )
+    run_parser.add_argument("-n", "--count", type=int, default=10_000)
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("-o", "--output", help="write results as JSON")
+
+    compare_parser = commands.add_parser(
+        "compare", help="report regressions between two result files"
+    )
+    compare_parser.add_argument("before")
+    compare_parser.add_argument("after")
+    compare_parser.add_argument("--threshold", type=float, default=0.10)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        data = run(args.mapper, args.workload, args.count, args.seed)
+        _print_results(data)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(data, f, indent=2)
+        return 0
+
+    with open(args.before) as f:
+        before = json.load(f)
+    with open(args.after) as f:
+        after = json.load(f)
+    regressions = compare(before, after, args.threshold)
+    for change in regressions:
+        print(
+            f"{change.mapper}/{change.workload} {change.metric}: "
+            f"{change.before:,.2f} -> {change.after:,.2f} ({change.ratio:.2f}x)"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+import math
+import multiprocessing
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Iterable, Optional
+
+from .. import registry
+from ..base import Mappable
+from .workloads import WORKLOADS, generate
+
+
+@dataclass
+class Result:
+    ops_per_sec: float
+    p50_us: float
+    p99_us: float
+    retained_blocks_per_record: float
+    bytes_per_record: float
+    peak_rss_kb: int
+
+
+def _percentile(sorted_ns: list[int], fraction: float) -> float:
+    if not sorted_ns:
+        return 0.0
+    index = min(len(sorted_ns) - 1, int(fraction * len(sorted_ns)))
+    return sorted_ns[index] / 1000
+
+
+def _peak_rss_kb() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def measure(
+    mapper: Mappable, records: list[dict[str, Any]], alloc_sample: int = 1000
+) -> Result:
+    """Benchmark one mapper over a list of records.
+
+    Latency is timed per call. Memory is measured in a separate pass over
+    at most `alloc_sample` records with tracemalloc running, since tracing
+    slows everything down; it counts the blocks and bytes still alive once
+    the outputs have been built, i.e. what each output document retains,
+    not every allocation made along the way. Peak RSS is the high-water
+    mark of the whole process, so it only describes this mapper when run
+    in a process of its own, as `run` does.
+
+    Args:
+        mapper (Mappable): the mapper under test
+        records (list[dict[str, Any]]): employee info
+        alloc_sample (int): records to trace allocations for
+
+    Returns:
+        Result: the measurements
+    """
+    for record in records[:100]:
+        mapper(record)
+
+    timings: list[int] = []
+    clock = time.perf_counter_ns
+    for record in records:
+        start = clock()
+        mapper(record)
+        timings.append(clock() - start)
+    timings.sort()
+
+    sample = records[:alloc_sample]
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        outputs = [mapper(record) for record in sample]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    del outputs
+
+    elapsed = sum(timings) / 1e9
+    return Result(
+        ops_per_sec=len(records) / elapsed if elapsed else 0.0,
+        p50_us=_percentile(timings, 0.50),
+        p99_us=_percentile(timings, 0.99),
+        retained_blocks_per_record=blocks / len(sample) if sample else 0.0,
+        bytes_per_record=size / len(sample) if sample else 0.0,
+        peak_rss_kb=_peak_rss_kb(),
+    )
+
+
+def _measure(name: str, workload: str, count: int, seed: int) -> dict[str, Any]:
+    return asdict(measure(registry.get_mapper(name), generate(workload, count, seed)))
+
+
+def run(
+    names: Optional[Iterable[str]] = None,
+    workloads: Optional[Iterable[str]] = None,
+    count: int = 10_000,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Benchmark mappers across workloads. Each mapper and workload is
+    measured in a fresh process, one at a time, so peak RSS covers only
+    that mapper and the timings don't compete with each other.
+
+    Args:
+        names (Optional[Iterable[str]]): mappers to run; defaults to all
+        workloads (Optional[Iterable[str]]): workloads to run; defaults to all
+        count (int): records per workload
+        seed (int): random seed for the generated records
+
+    Returns:
+        dict[str, Any]: JSON-serializable results, keyed by mapper and workload
+    """
+    names = list(names or registry.names())
+    workloads = list(workloads or WORKLOADS)
+    cells = [(name, workload) for name in names for workload in workloads]
+
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1, maxtasksperchild=1) as pool:
+        measured = pool.starmap(
+            _measure, [(name, workload, count, seed) for name, workload in cells]
+        )
+    results: dict[str, dict[str, Any]] = {name: {} for name in names}
+    for (name, workload), metrics in zip(cells, measured):
+        results[name][workload] = metrics
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "count": count,
+            "seed": seed,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+
+@dataclass
+class Change:
+    mapper: str
+    workload: str
+    metric: str
+    before: float
+    after: float
+
+    @property
+    def ratio(self) -> float:
+        if self.before == 0:
+            return 1.0 if self.after == 0 else math.inf
+        return self.after / self.before
+
+
+# Whether a bigger number is better for each metric.
+METRICS = {
+    "ops_per_sec": True,
+    "p50_us": False,
+    "p99_us": False,
+    "retained_blocks_per_record": False,
+    "bytes_per_record": False,
+}
+
+
+def compare(
+    before: dict[str, Any], after: dict[str, Any], threshold: float = 0.10
+) -> list[Change]:
+    """Find metrics that got worse by more than `threshold` between two
+    runs. Mappers, workloads or metrics missing from either run are
+    skipped.
+
+    Args:
+        before (dict[str, Any]): results of the baseline run
+        after (dict[str, Any]): results of the new run
+        threshold (float): relative change tolerated before flagging
+
+    Returns:
+        list[Change]: the regressions
+    """
+    regressions: list[Change] = []
+    for name, workloads in after["results"].items():
+        for workload, metrics in workloads.items():
+            baseline = before["results"].get(name, {}).get(workload)
+            if baseline is None:
+                continue
+            for metric, higher_is_better in METRICS.items():
+                if metric not in baseline or metric not in metrics:
+                    continue
+                change = Change(
+                    name, workload, metric, baseline[metric], metrics[metric]
+                )
+                # Whichever value should be the lower one, compared by
+                # multiplying rather than by ratio so a zero can't divide.
+                low, high = (
+                    (change.after, change.before)
+                    if higher_is_better
+                    else (change.before, change.after)
+                )
+                if high > low * (1 + threshold):
+                    regressions.append(change)
+    return regressions
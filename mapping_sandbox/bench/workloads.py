@@ -0,0 +1,58 @@
+import random
+from typing import Any, Callable, Optional
+
+# =====================================================================
+# Synthetic inputs for benchmarking, one generator per workload shape.
+# Each mirrors one of the cases in the README: required fields only,
+# with a CompanyCode, and with both CompanyCode and EmploymentStatus.
+# =====================================================================
+
+COMPANY_CODES = ["VOLKSFREI", "NAKATOMI", "CLAYTON", "KLAXON"]
+STATUSES = ["ACTIVE", "ON_LEAVE", "TERMINATED"]
+
+
+def required(rng: random.Random, n: int) -> dict[str, Any]:
+    return {
+        "EventTimestamp": f"2023-11-{1 + n % 28:02}T02:15:42.{n % 1_000_000:06}",
+        "EmployeeNumber": f"{rng.randrange(1_000_000):06}",
+        "FirstName": rng.choice(["John", "Holly", "Hans", "Karl", "Al"]),
+        "LastName": rng.choice(["McClane", "Gennero", "Gruber", "Powell"]),
+    }
+
+
+def company(rng: random.Random, n: int) -> dict[str, Any]:
+    return {**required(rng, n), "CompanyCode": rng.choice(COMPANY_CODES)}
+
+
+def status(rng: random.Random, n: int) -> dict[str, Any]:
+    return {**company(rng, n), "EmploymentStatus": rng.choice(STATUSES)}
+
+
+def mixed(rng: random.Random, n: int) -> dict[str, Any]:
+    return rng.choice([required, company, status])(rng, n)
+
+
+WORKLOADS: dict[str, Callable[[random.Random, int], dict[str, Any]]] = {
+    "required": required,
+    "company": company,
+    "status": status,
+    "mixed": mixed,
+}
+
+
+def generate(
+    workload: str, count: int, seed: Optional[int] = 0
+) -> list[dict[str, Any]]:
+    """Generate a reproducible list of inputs for a workload.
+
+    Args:
+        workload (str): one of the names in `WORKLOADS`
+        count (int): number of records
+        seed (Optional[int]): random seed; the same seed gives the same records
+
+    Returns:
+        list[dict[str, Any]]: employee info
+    """
+    rng = random.Random(seed)
+    make = WORKLOADS[workload]
+    return [make(rng, n) for n in range(count)]
@@ -0,0 +1,153 @@
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from .base import Mappable
+
+
+@dataclass
+class Coalesced:
+    """A mapped survivor of a window, with what a sink needs to check
+    ordering: windows are numbered from 0, `sequence` is the survivor's
+    position in the input stream, and `superseded` counts the records for
+    the same employee that it replaced within the window."""
+
+    output: dict[str, Any]
+    employee_number: str
+    event_timestamp: str
+    window: int
+    sequence: int
+    superseded: int
+
+
+class Coalescer:
+    """Keeps only the newest record per `EmployeeNumber` within each window
+    and maps just those. A window closes once it holds `max_records`
+    records, or once `max_seconds` have passed since its first record
+    arrived, whichever comes first; `flush` closes it early.
+
+    Windows are only checked against the clock when something calls in:
+    `add` checks before adding, and `poll` checks without adding. A
+    stream that goes quiet keeps its last window open until one of them
+    is called, so call `poll` on a timer (or `flush` when idle) if
+    survivors mustn't wait for the next record.
+
+    "Newest" is the greatest `EventTimestamp`, compared as strings, which
+    is correct for the ISO 8601 timestamps the source sends. On a tie the
+    later arrival wins.
+
+    Survivors of a window are emitted in arrival order, so `window` and
+    `sequence` always increase along the output.
+
+    Args:
+        mapper (Mappable): maps the surviving records
+        max_records (Optional[int]): records per window
+        max_seconds (Optional[float]): seconds per window
+    """
+
+    def __init__(
+        self,
+        mapper: Mappable,
+        max_records: Optional[int] = 10_000,
+        max_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_records is None and max_seconds is None:
+            raise ValueError("a window needs max_records, max_seconds, or both")
+        self.mapper = mapper
+        self.max_records = max_records
+        self.max_seconds = max_seconds
+        self._clock = clock
+        self._window = 0
+        self._sequence = 0
+        self._count = 0
+        self._opened = 0.0
+        # EmployeeNumber -> (sequence, superseded, record)
+        self._latest: dict[str, tuple[int, int, dict[str, Any]]] = {}
+
+    def add(self, record: dict[str, Any]) -> list[Coalesced]:
+        """Add a record to the current window.
+
+        Args:
+            record (dict[str, Any]): employee info
+
+        Returns:
+            list[Coalesced]: the survivors, if this record closed the window
+        """
+        now = self._clock()
+        flushed = self.flush() if self._expired(now) else []
+        if not self._count:
+            self._opened = now
+
+        number = record["EmployeeNumber"]
+        current = self._latest.get(number)
+        if current is None:
+            self._latest[number] = (self._sequence, 0, record)
+        else:
+            _, superseded, kept = current
+            if record["EventTimestamp"] >= kept["EventTimestamp"]:
+                self._latest[number] = (self._sequence, superseded + 1, record)
+            else:
+                self._latest[number] = (current[0], superseded + 1, kept)
+        self._sequence += 1
+        self._count += 1
+
+        if self.max_records is not None and self._count >= self.max_records:
+            flushed += self.flush()
+        return flushed
+
+    def _expired(self, now: float) -> bool:
+        return (
+            self._count > 0
+            and self.max_seconds is not None
+            and now - self._opened >= self.max_seconds
+        )
+
+    def poll(self) -> list[Coalesced]:
+        """Close the current window if its time is up.
+
+        Returns:
+            list[Coalesced]: the survivors, if the window closed
+        """
+        return self.flush() if self._expired(self._clock()) else []
+
+    def flush(self) -> list[Coalesced]:
+        """Close the current window and map its survivors. If the mapper
+        raises, the window is left open as it was, so nothing in it is
+        lost and the flush can be retried.
+
+        Returns:
+            list[Coalesced]: the survivors, in arrival order
+        """
+        survivors = sorted(self._latest.values(), key=lambda entry: entry[0])
+        if not survivors:
+            self._count = 0
+            return []
+        flushed = [
+            Coalesced(
+                self.mapper(record),
+                record["EmployeeNumber"],
+                record["EventTimestamp"],
+                self._window,
+                sequence,
+                superseded,
+            )
+            for sequence, superseded, record in survivors
+        ]
+        self._latest = {}
+        self._count = 0
+        self._window += 1
+        return flushed
+
+    def coalesce(self, records: Iterable[dict[str, Any]]) -> Iterator[Coalesced]:
+        """Run a whole stream through the coalescer, flushing at the end.
+
+        Args:
+            records (Iterable[dict[str, Any]]): employee info
+
+        Yields:
+            Coalesced: the mapped survivors of each window
+        """
+        for record in records:
+            yield from self.add(record)
+        yield from self.flush()
@@ -0,0 +1,103 @@
+import operator
+from itertools import compress, repeat
+from typing import Any, Mapping, Optional, Sequence
+
+REQUIRED_COLUMNS = ("EventTimestamp", "EmployeeNumber", "FirstName", "LastName")
+OPTIONAL_COLUMNS = ("CompanyCode", "EmploymentStatus")
+
+
+def _present(column: Optional[Sequence[Any]], length: int) -> list[bool]:
+    # The null mask, computed with map() over a C-level comparison rather
+    # than a Python-level loop.
+    if column is None:
+        return [False] * length
+    return list(map(operator.is_not, column, repeat(None)))
+
+
+def map_columns(
+    columns: Mapping[str, Sequence[Any]], share_constants: bool = False
+) -> list[dict[str, Any]]:
+    """Map a batch of inputs given as columns, one sequence per field, as
+    they come out of CSV or parquet-style exports. `CompanyCode` and
+    `EmploymentStatus` may be missing entirely or contain `None` for rows
+    where they're absent; as elsewhere, a status without a company code is
+    ignored. Any other columns are ignored too.
+
+    With `share_constants`, the constant parts of the output (the `hr_id`
+    entry, `config_flag`, the company `type`) are built once and shared by
+    every output document, which saves a lot of allocation on big batches,
+    but the outputs must then be treated as read-only: changing a shared
+    subtree in one document changes it in all of them.
+
+    Args:
+        columns (Mapping[str, Sequence[Any]]): employee info, by field
+        share_constants (bool): share constant subtrees between outputs
+
+    Returns:
+        list[dict[str, Any]]: employee info in output format, one per row
+    """
+    missing = [name for name in REQUIRED_COLUMNS if name not in columns]
+    if missing:
+        raise KeyError(f"missing required columns: {', '.join(missing)}")
+    lengths = {
+        len(columns[name])
+        for name in REQUIRED_COLUMNS + OPTIONAL_COLUMNS
+        if name in columns
+    }
+    if len(lengths) > 1:
+        raise ValueError(f"columns have different lengths: {sorted(lengths)}")
+    length = lengths.pop() if lengths else 0
+
+    timestamps = columns["EventTimestamp"]
+    numbers = columns["EmployeeNumber"]
+    company_codes = columns.get("CompanyCode")
+    statuses = columns.get("EmploymentStatus")
+
+    first_names = columns["FirstName"]
+    last_names = columns["LastName"]
+    hr_id: Any = {"value": {"type": [{"value": "hr_id"}]}}
+    config_flag: Any = [{"value": False}]
+    attributes = [
+        {
+            "first_name": first_names[i],
+            "last_name": last_names[i],
+            "ids": [
+                hr_id if share_constants else {"value": {"type": [{"value": "hr_id"}]}},
+                {"value": {"id": numbers[i]}},
+            ],
+            "config_flag": config_flag if share_constants else [{"value": False}],
+        }
+        for i in range(length)
+    ]
+
+    has_company = _present(company_codes, length)
+    has_status = list(map(operator.and_, has_company, _present(statuses, length)))
+
+    if company_codes is not None:
+        company_type: Any = [{"value": ""}]
+        companies: dict[int, dict[str, Any]] = {}
+        for i in compress(range(length), has_company):
+            company = {
+                "type": company_type if share_constants else [{"value": ""}],
+                "company_code": [{"value": company_codes[i]}],
+            }
+            companies[i] = company
+            attributes[i]["company"] = [{"value": company}]
+        if statuses is not None:
+            for i in compress(range(length), has_status):
+                companies[i]["status"] = [{"value": statuses[i]}]
+
+    return [
+        {
+            "type": "namespace/employee",
+            "attributes": attributes[i],
+            "metadata": [
+                {
+                    "type": "namespace/source/name",
+                    "value": numbers[i],
+                    "update_date": timestamps[i],
+                }
+            ],
+        }
+        for i in range(length)
+    ]
@@ -0,0 +1,212 @@
+from collections.abc import Mapping
+from typing import Any, Iterator, Optional
+
+from . import encoding
+
+
+class _Missing:
+    def __repr__(self) -> str:
+        return "MISSING"
+
+    def __reduce__(self) -> str:
+        # Unpickle as the module's own instance, so `is MISSING` still holds.
+        return "MISSING"
+
+
+# Marks an optional field that wasn't in the input, as opposed to one that
+# was there with a value of None.
+MISSING: Any = _Missing()
+
+_KEYS = ("type", "attributes", "metadata")
+
+
+class CompactEmployee(Mapping):  # type: ignore[type-arg]
+    """An output document that only stores the fields that vary, and
+    builds the nested structure the first time someone reads it.
+
+    It's a read-only `Mapping` equal to the dict the mappers return, so
+    code that indexes into the output works unchanged, but stages that
+    only need an employee id or company can read `employee_number` and
+    `company_code` straight off the slots without building anything.
+    `to_json` writes the document without building it either. The stdlib
+    `json` only encodes real dicts, so pass `default=json_default` to
+    `json.dump(s)` to encode one there.
+
+    It's built by `from_input`, which mirrors `with_python.mapper` field
+    for field and uses no other mapper's machinery. A `compact=` flag on
+    the pipeline, reduce or spec mappers would skip exactly what makes
+    them different and hand back this same object, so it's offered once,
+    on `with_python`; call `from_input` directly anywhere else.
+
+    Like `with_python.mapper`, optional fields are keyed on presence: an
+    input with `"CompanyCode": None` gets a company with a null code.
+    """
+
+    __slots__ = (
+        "event_timestamp",
+        "employee_number",
+        "first_name",
+        "last_name",
+        "company_code",
+        "employment_status",
+        "_document",
+    )
+
+    def __init__(
+        self,
+        event_timestamp: Any,
+        employee_number: Any,
+        first_name: Any,
+        last_name: Any,
+        company_code: Any = MISSING,
+        employment_status: Any = MISSING,
+    ) -> None:
+        self.event_timestamp = event_timestamp
+        self.employee_number = employee_number
+        self.first_name = first_name
+        self.last_name = last_name
+        self.company_code = company_code
+        # A status only shows up inside a company.
+        self.employment_status = (
+            employment_status if company_code is not MISSING else MISSING
+        )
+        self._document: Optional[dict[str, Any]] = None
+
+    @classmethod
+    def from_input(cls, input: dict[str, Any]) -> "CompactEmployee":
+        """Map employee info into a compact document.
+
+        Args:
+            input (dict[str, Any]): employee info
+
+        Returns:
+            CompactEmployee: employee info in output format
+        """
+        return cls(
+            input["EventTimestamp"],
+            input["EmployeeNumber"],
+            input["FirstName"],
+            input["LastName"],
+            input.get("CompanyCode", MISSING),
+            input.get("EmploymentStatus", MISSING),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Build the document as a fresh dict, exactly as the mappers
+        return it.
+
+        Returns:
+            dict[str, Any]: employee info in output format
+        """
+        attributes: dict[str, Any] = {
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+            "ids": [
+                {"value": {"type": [{"value": "hr_id"}]}},
+                {"value": {"id": self.employee_number}},
+            ],
+            "config_flag": [{"value": False}],
+        }
+        if self.company_code is not MISSING:
+            company: dict[str, Any] = {
+                "type": [{"value": ""}],
+                "company_code": [{"value": self.company_code}],
+            }
+            if self.employment_status is not MISSING:
+                company["status"] = [{"value": self.employment_status}]
+            attributes["company"] = [{"value": company}]
+        return {
+            "type": "namespace/employee",
+            "attributes": attributes,
+            "metadata": [
+                {
+                    "type": "namespace/source/name",
+                    "value": self.employee_number,
+                    "update_date": self.event_timestamp,
+                }
+            ],
+        }
+
+    def to_json(self) -> bytes:
+        """Write the document as compact JSON without building it.
+
+        Returns:
+            bytes: employee info in output format, as UTF-8 JSON
+        """
+        input = {
+            "EventTimestamp": self.event_timestamp,
+            "EmployeeNumber": self.employee_number,
+            "FirstName": self.first_name,
+            "LastName": self.last_name,
+        }
+        if self.company_code is not MISSING:
+            input["CompanyCode"] = self.company_code
+            if self.employment_status is not MISSING:
+                input["EmploymentStatus"] = self.employment_status
+        return encoding.map_to_json(input)
+
+    def _fields(self) -> tuple[Any, ...]:
+        return (
+            self.event_timestamp,
+            self.employee_number,
+            self.first_name,
+            self.last_name,
+            self.company_code,
+            self.employment_status,
+        )
+
+    # Mapping interface. The document is built once, on first access, and
+    # kept, so what indexing hands out is shared: treat it as read-only, or
+    # take a `to_dict` of your own.
+
+    def __getitem__(self, key: str) -> Any:
+        if self._document is None:
+            self._document = self.to_dict()
+        return self._document[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_KEYS)
+
+    def __len__(self) -> int:
+        return len(_KEYS)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _KEYS
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CompactEmployee):
+            return self._fields() == other._fields()
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={value!r}"
+            for name, value in zip(self.__slots__, self._fields())
+            if value is not MISSING
+        )
+        return f"CompactEmployee({fields})"
+
+    def __getstate__(self) -> tuple[Any, ...]:
+        return self._fields()
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+        self.__init__(*state)  # type: ignore[misc]
+
+
+def json_default(value: Any) -> Any:
+    """A `default` for `json.dump(s)` and `json.JSONEncoder` that encodes
+    `CompactEmployee`s as the document they stand for.
+
+    Args:
+        value (Any): a value the encoder doesn't know how to encode
+
+    Returns:
+        Any: the document, as a dict
+    """
+    if isinstance(value, CompactEmployee):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
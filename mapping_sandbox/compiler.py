@@ -0,0 +1,294 @@
+import json
+import linecache
+from dataclasses import dataclass
+from itertools import count
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+from .artifacts import compile_cached
+from .base import BatchMappable, Mappable
+from .encoding import quote
+
+# =====================================================================
+# A declarative mapping spec is a nested literal shaped exactly like the
+# output. Leaves are either constants or `Field` references to input
+# keys; a dict value wrapped in `When` is only emitted when its input key
+# is present. The compiler turns a spec into Python source once, at load
+# time, so the resulting mapper does no per-call interpretation at all.
+# =====================================================================
+
+
+@dataclass(frozen=True)
+class Field:
+    """A required input field, copied verbatim into the output."""
+
+    key: str
+
+
+@dataclass(frozen=True)
+class When:
+    """An optional dict entry: emitted only if `key` is in the input."""
+
+    key: str
+    spec: Any
+
+
+Spec = Union[dict[str, Any], list[Any], Field, str, int, float, bool, None]
+
+_CONSTANTS = (str, int, float, bool, type(None))
+
+
+class _Generator:
+    def __init__(self) -> None:
+        self.names = (f"_n{i}" for i in count())
+        self.fields: dict[str, str] = {}
+
+    def field(self, key: str) -> str:
+        if key not in self.fields:
+            self.fields[key] = f"_f{len(self.fields)}"
+        return self.fields[key]
+
+    def body(self, spec: Spec) -> tuple[list[str], str]:
+        """Emit the statements that build `spec` and the expression that
+        evaluates to it. Statements only appear for dicts with `When`
+        entries; everything else is folded into one nested literal."""
+        statements: list[str] = []
+        expr = self.expression(spec, statements, guards=())
+        reads = [f"{name} = input[{key!r}]" for key, name in self.fields.items()]
+        return reads + statements, expr
+
+    def expression(
+        self, spec: Spec, statements: list[str], guards: tuple[str, ...]
+    ) -> str:
+        if isinstance(spec, Field):
+            if spec.key in guards:
+                return f"input[{spec.key!r}]"
+            return self.field(spec.key)
+        if isinstance(spec, When):
+            raise TypeError(f"When({spec.key!r}) is only allowed as a dict value")
+        if isinstance(spec, list):
+            items = (self.expression(item, statements, guards) for item in spec)
+            return "[" + ", ".join(items) + "]"
+        if isinstance(spec, dict):
+            return self.dict_expression(spec, statements, guards)
+        if isinstance(spec, _CONSTANTS):
+            return repr(spec)
+        raise TypeError(f"Unsupported spec value: {spec!r}")
+
+    def dict_expression(
+        self, spec: dict[str, Any], statements: list[str], guards: tuple[str, ...]
+    ) -> str:
+        required = {k: v for k, v in spec.items() if not isinstance(v, When)}
+        optional = {k: v for k, v in spec.items() if isinstance(v, When)}
+        literal = (
+            "{"
+            + ", ".join(
+                f"{key!r}: {self.expression(value, statements, guards)}"
+                for key, value in required.items()
+            )
+            + "}"
+        )
+        if not optional:
+            return literal
+
+        name = next(self.names)
+        statements.append(f"{name} = {literal}")
+        for key, when in optional.items():
+            nested: list[str] = []
+            value = self.expression(when.spec, nested, guards + (when.key,))
+            statements.append(f"if {when.key!r} in input:")
+            statements.extend(f"    {line}" for line in nested)
+            statements.append(f"    {name}[{key!r}] = {value}")
+        return name
+
+
+# A piece of generated JSON text: either a constant or a Python expression
+# that evaluates to a string.
+_Segment = tuple[bool, str]
+
+
+class _JsonGenerator(_Generator):
+    """Generates code that writes the output as JSON text directly. Every
+    constant part of the spec is serialized at compile time and merged
+    into as few string literals as possible; only fields are encoded per
+    call, by `_quote`."""
+
+    def expression(
+        self, spec: Spec, statements: list[str], guards: tuple[str, ...]
+    ) -> str:
+        return self.join(self.segments(spec, statements, guards))
+
+    def join(self, segments: list[_Segment]) -> str:
+        merged: list[_Segment] = []
+        for is_code, text in segments:
+            if merged and not is_code and not merged[-1][0]:
+                merged[-1] = (False, merged[-1][1] + text)
+            else:
+                merged.append((is_code, text))
+        parts = [text if is_code else repr(text) for is_code, text in merged]
+        return parts[0] if len(parts) == 1 else "".join(["(", " + ".join(parts), ")"])
+
+    def segments(
+        self, spec: Spec, statements: list[str], guards: tuple[str, ...]
+    ) -> list[_Segment]:
+        if isinstance(spec, Field):
+            ref = f"input[{spec.key!r}]" if spec.key in guards else self.field(spec.key)
+            return [(True, f"_quote({ref})")]
+        if isinstance(spec, When):
+            raise TypeError(f"When({spec.key!r}) is only allowed as a dict value")
+        if isinstance(spec, list):
+            segments: list[_Segment] = [(False, "[")]
+            for i, item in enumerate(spec):
+                if i:
+                    segments.append((False, ","))
+                segments.extend(self.segments(item, statements, guards))
+            return segments + [(False, "]")]
+        if isinstance(spec, dict):
+            return self.dict_segments(spec, statements, guards)
+        if isinstance(spec, _CONSTANTS):
+            return [(False, json.dumps(spec))]
+        raise TypeError(f"Unsupported spec value: {spec!r}")
+
+    def member(
+        self, key: str, value: Spec, statements: list[str], guards: tuple[str, ...]
+    ) -> list[_Segment]:
+        return [(False, json.dumps(key) + ":")] + self.segments(
+            value, statements, guards
+        )
+
+    def dict_segments(
+        self, spec: dict[str, Any], statements: list[str], guards: tuple[str, ...]
+    ) -> list[_Segment]:
+        required = {k: v for k, v in spec.items() if not isinstance(v, When)}
+        optional = {k: v for k, v in spec.items() if isinstance(v, When)}
+        if not optional:
+            segments: list[_Segment] = [(False, "{")]
+            for i, (key, value) in enumerate(required.items()):
+                if i:
+                    segments.append((False, ","))
+                segments.extend(self.member(key, value, statements, guards))
+            return segments + [(False, "}")]
+
+        # Optional members make the commas conditional, so collect the
+        # members in a list and join them.
+        name = next(self.names)
+        members = (
+            self.join(self.member(key, value, statements, guards))
+            for key, value in required.items()
+        )
+        statements.append(f"{name} = [{', '.join(members)}]")
+        for key, when in optional.items():
+            nested: list[str] = []
+            member = self.join(
+                self.member(key, when.spec, nested, guards + (when.key,))
+            )
+            statements.append(f"if {when.key!r} in input:")
+            statements.extend(f"    {line}" for line in nested)
+            statements.append(f"    {name}.append({member})")
+        return [(False, "{"), (True, f"','.join({name})"), (False, "}")]
+
+
+def generate_source(spec: Spec, name: str = "mapper", to_json: bool = False) -> str:
+    """Generate the source of a mapper for `spec`, alongside a
+    `map_many` style batch function named `<name>_many`.
+
+    Args:
+        spec (Spec): the declarative mapping spec
+        name (str): name of the generated mapper function
+        to_json (bool): return compact JSON bytes rather than a dict
+
+    Returns:
+        str: Python source defining both functions
+    """
+    generator = _JsonGenerator() if to_json else _Generator()
+    statements, expr = generator.body(spec)
+    if to_json:
+        expr = f"{expr}.encode()"
+
+    def indent(lines: Iterable[str], depth: int) -> Iterator[str]:
+        return (" " * depth + line for line in lines)
+
+    return "\n".join(
+        [
+            f"def {name}(input):",
+            *indent(statements, 4),
+            f"    return {expr}",
+            "",
+            f"def {name}_many(records):",
+            "    outputs = []",
+            "    append = outputs.append",
+            "    for input in records:",
+            *indent(statements, 8),
+            f"        append({expr})",
+            "    return outputs",
+            "",
+        ]
+    )
+
+
+def _compile(
+    spec: Spec, name: str, module: Optional[str], to_json: bool = False
+) -> dict[str, Any]:
+    source = generate_source(spec, name, to_json)
+    filename = f"<mapping spec {module or __name__}.{name}>"
+    # Registering the source with linecache gives readable tracebacks
+    # (e.g. a KeyError for a missing required field) from generated code.
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    namespace: dict[str, Any] = {"__name__": module or __name__, "_quote": quote}
+    exec(compile_cached(source, filename), namespace)
+    return namespace
+
+
+def compile_spec(
+    spec: Spec, name: str = "mapper", module: Optional[str] = None
+) -> Mappable:
+    """Compile a spec into a specialized mapper function.
+
+    Args:
+        spec (Spec): the declarative mapping spec
+        name (str): name of the generated function
+        module (Optional[str]): module to attribute the function to
+
+    Returns:
+        Mappable: the compiled mapper
+    """
+    mapper: Mappable = _compile(spec, name, module)[name]
+    return mapper
+
+
+def compile_batch_spec(
+    spec: Spec, name: str = "mapper", module: Optional[str] = None
+) -> BatchMappable:
+    """Compile a spec into a specialized batch mapper. The per-record code
+    is inlined into the loop, so there isn't even a function call per
+    record.
+
+    Args:
+        spec (Spec): the declarative mapping spec
+        name (str): base name of the generated function
+        module (Optional[str]): module to attribute the function to
+
+    Returns:
+        BatchMappable: the compiled batch mapper
+    """
+    map_many: BatchMappable = _compile(spec, name, module)[f"{name}_many"]
+    return map_many
+
+
+def compile_json_spec(
+    spec: Spec, name: str = "map_to_json", module: Optional[str] = None
+) -> Callable[[dict[str, Any]], bytes]:
+    """Compile a spec into a function that writes the output as compact
+    JSON bytes, without building the output dict first.
+
+    Args:
+        spec (Spec): the declarative mapping spec
+        name (str): name of the generated function
+        module (Optional[str]): module to attribute the function to
+
+    Returns:
+        Callable[[dict[str, Any]], bytes]: the compiled JSON mapper
+    """
+    map_to_json: Callable[[dict[str, Any]], bytes] = _compile(
+        spec, name, module, to_json=True
+    )[name]
+    return map_to_json
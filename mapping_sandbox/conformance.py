@@ -0,0 +1,131 @@
+from typing import Any
+
+from .base import Mappable
+
+# =====================================================================
+# The reference cases from the README: required fields only, both
+# optional fields, and CompanyCode alone, for checking mappers at
+# runtime. The tests keep their own literals; this is a copy of them,
+# and tests/test_end_to_end.py checks that it still matches.
+# =====================================================================
+
+REFERENCE_CASES: list[tuple[dict[str, Any], dict[str, Any]]] = [
+    (
+        {
+            "EventTimestamp": "2023-11-02T02:15:42.847038",
+            "EmployeeNumber": "012345",
+            "FirstName": "John",
+            "LastName": "McClane",
+        },
+        {
+            "type": "namespace/employee",
+            "attributes": {
+                "first_name": "John",
+                "last_name": "McClane",
+                "ids": [
+                    {"value": {"type": [{"value": "hr_id"}]}},
+                    {"value": {"id": "012345"}},
+                ],
+                "config_flag": [{"value": False}],
+            },
+            "metadata": [
+                {
+                    "type": "namespace/source/name",
+                    "value": "012345",
+                    "update_date": "2023-11-02T02:15:42.847038",
+                }
+            ],
+        },
+    ),
+    (
+        {
+            "EventTimestamp": "2023-11-02T02:15:42.847038",
+            "EmployeeNumber": "054321",
+            "FirstName": "Hans",
+            "LastName": "Gruber",
+            "CompanyCode": "VOLKSFREI",
+            "EmploymentStatus": "TERMINATED",
+        },
+        {
+            "type": "namespace/employee",
+            "attributes": {
+                "first_name": "Hans",
+                "last_name": "Gruber",
+                "ids": [
+                    {"value": {"type": [{"value": "hr_id"}]}},
+                    {"value": {"id": "054321"}},
+                ],
+                "config_flag": [{"value": False}],
+                "company": [
+                    {
+                        "value": {
+                            "type": [{"value": ""}],
+                            "company_code": [{"value": "VOLKSFREI"}],
+                            "status": [{"value": "TERMINATED"}],
+                        }
+                    }
+                ],
+            },
+            "metadata": [
+                {
+                    "type": "namespace/source/name",
+                    "value": "054321",
+                    "update_date": "2023-11-02T02:15:42.847038",
+                }
+            ],
+        },
+    ),
+    (
+        {
+            "EventTimestamp": "2023-11-02T02:15:42.847038",
+            "EmployeeNumber": "054321",
+            "FirstName": "Hans",
+            "LastName": "Gruber",
+            "CompanyCode": "VOLKSFREI",
+        },
+        {
+            "type": "namespace/employee",
+            "attributes": {
+                "first_name": "Hans",
+                "last_name": "Gruber",
+                "ids": [
+                    {"value": {"type": [{"value": "hr_id"}]}},
+                    {"value": {"id": "054321"}},
+                ],
+                "config_flag": [{"value": False}],
+                "company": [
+                    {
+                        "value": {
+                            "type": [{"value": ""}],
+                            "company_code": [{"value": "VOLKSFREI"}],
+                        }
+                    }
+                ],
+            },
+            "metadata": [
+                {
+                    "type": "namespace/source/name",
+                    "value": "054321",
+                    "update_date": "2023-11-02T02:15:42.847038",
+                }
+            ],
+        },
+    ),
+]
+
+
+def conforms(mapper: Mappable) -> bool:
+    """Whether a mapper gets every reference case right.
+
+    Args:
+        mapper (Mappable): the mapper to check
+
+    Returns:
+        bool: True if every case maps to its expected output
+    """
+    try:
+        return all(
+            mapper(dict(input)) == expected for input, expected in REFERENCE_CASES
+        )
+    except Exception:
+        return False
@@ -0,0 +1,128 @@
+import contextlib
+import itertools
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from .base import Mappable
+
+# A record that exercises every branch of a mapper (both optional fields),
+# used to warm up templates, schemas and skeletons in each worker before
+# the first real chunk arrives.
+WARMUP_RECORD: dict[str, Any] = {
+    "EventTimestamp": "2023-11-02T02:15:42.847038",
+    "EmployeeNumber": "054321",
+    "FirstName": "Hans",
+    "LastName": "Gruber",
+    "CompanyCode": "VOLKSFREI",
+    "EmploymentStatus": "TERMINATED",
+}
+
+
+@dataclass
+class Failure:
+    """Stands in for the output of a record that couldn't be mapped."""
+
+    index: int
+    error: str
+    record: dict[str, Any]
+
+
+Outcome = Union[dict[str, Any], Failure]
+
+_mapper: Optional[Mappable] = None
+
+
+def _initialize(mapper: Mappable) -> None:
+    global _mapper
+    _mapper = mapper
+    # Warmup is best effort: a mapper that rejects the sample record will
+    # report the same problem for real records.
+    with contextlib.suppress(Exception):
+        mapper(WARMUP_RECORD)
+
+
+def _map_chunk(start: int, chunk: list[dict[str, Any]]) -> list[Outcome]:
+    assert _mapper is not None, "worker was not initialized"
+    outcomes: list[Outcome] = []
+    for index, record in enumerate(chunk, start):
+        try:
+            outcomes.append(_mapper(record))
+        except Exception as e:
+            outcomes.append(Failure(index, f"{type(e).__name__}: {e}", record))
+    return outcomes
+
+
+def chunks(
+    records: Iterable[dict[str, Any]], size: int
+) -> Iterator[tuple[int, list[dict[str, Any]]]]:
+    """Cut records into lists of at most `size`, without reading ahead.
+
+    Args:
+        records (Iterable[dict[str, Any]]): employee info
+        size (int): most records per chunk
+
+    Yields:
+        tuple[int, list[dict[str, Any]]]: the index of the chunk's first
+            record, and the chunk
+    """
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    iterator = iter(records)
+    start = 0
+    while chunk := list(itertools.islice(iterator, size)):
+        yield start, chunk
+        start += len(chunk)
+
+
+def map_parallel(
+    mapper: Mappable,
+    records: Iterable[dict[str, Any]],
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+) -> Iterator[Outcome]:
+    """Map records across a pool of worker processes.
+
+    The mapper must be picklable, i.e. a module-level function such as
+    `with_python.mapper`. Each worker maps one record up front to warm up
+    whatever the mapper caches. Outputs come back in input order; a record
+    that fails to map yields a `Failure` in its place instead of taking the
+    rest of its chunk down with it.
+
+    Args:
+        mapper (Mappable): the mapper to run in each worker
+        records (Iterable[dict[str, Any]]): employee info
+        workers (Optional[int]): number of processes; defaults to the CPU count
+        chunk_size (int): records sent to a worker at a time
+
+    Returns:
+        Iterator[Outcome]: employee info in output format, or a `Failure`
+    """
+    # Checked here rather than in the generator, so a bad argument raises
+    # at the call and not at the first `next()`.
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    return _map_parallel(mapper, records, workers, chunk_size)
+
+
+def _map_parallel(
+    mapper: Mappable, records: Iterable[dict[str, Any]], workers: int, chunk_size: int
+) -> Iterator[Outcome]:
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_initialize, initargs=(mapper,)
+    ) as pool:
+        # Keep a couple of chunks queued per worker, no more, so a huge
+        # input is streamed through the pool rather than loaded up front.
+        pending: deque[Future[list[Outcome]]] = deque()
+        for start, chunk in chunks(records, chunk_size):
+            pending.append(pool.submit(_map_chunk, start, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
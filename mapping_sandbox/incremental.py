@@ -0,0 +1,100 @@
+from typing import Any
+
+from .with_pipeline import (
+    map_company_code,
+    map_employee_number,
+    map_employment_status,
+    map_event_timestamp,
+    map_first_name,
+    map_last_name,
+)
+
+_MISSING = object()
+
+FIELDS = (
+    "EventTimestamp",
+    "EmployeeNumber",
+    "FirstName",
+    "LastName",
+    "CompanyCode",
+    "EmploymentStatus",
+)
+
+
+def changed_fields(previous: dict[str, Any], input: dict[str, Any]) -> set[str]:
+    """The mapped source fields that differ between two inputs, including
+    optional fields that were added or removed.
+
+    Args:
+        previous (dict[str, Any]): the earlier employee info
+        input (dict[str, Any]): the new employee info
+
+    Returns:
+        set[str]: names of the fields that changed
+    """
+    return {
+        field
+        for field in FIELDS
+        if previous.get(field, _MISSING) != input.get(field, _MISSING)
+    }
+
+
+def remap(
+    previous_input: dict[str, Any],
+    previous_output: dict[str, Any],
+    input: dict[str, Any],
+) -> dict[str, Any]:
+    """Map `input` by patching the output of a previous, similar input,
+    rather than mapping it from scratch. Only the `with_pipeline` steps for
+    the fields that changed are re-run. The containers on the path to each
+    changed value are copied and everything else is shared with
+    `previous_output`, which is never modified. The result is equal to
+    `with_python.mapper(input)`.
+
+    Because subtrees are shared, treat both outputs as read-only once
+    `remap` has been called on them.
+
+    Args:
+        previous_input (dict[str, Any]): employee info that was mapped before
+        previous_output (dict[str, Any]): the mapped output for it
+        input (dict[str, Any]): the new employee info
+
+    Returns:
+        dict[str, Any]: employee info in output format
+    """
+    changed = changed_fields(previous_input, input)
+    output = dict(previous_output)
+    if not changed:
+        return output
+
+    if changed & {"EventTimestamp", "EmployeeNumber"}:
+        output["metadata"] = [dict(previous_output["metadata"][0])]
+    if changed - {"EventTimestamp"}:
+        output["attributes"] = attributes = dict(previous_output["attributes"])
+
+    if "EventTimestamp" in changed:
+        map_event_timestamp(output, input)
+    if "EmployeeNumber" in changed:
+        # Keep the shared hr_id entry; the step appends the new id.
+        attributes["ids"] = attributes["ids"][:1]
+        map_employee_number(output, input)
+    if "FirstName" in changed:
+        map_first_name(output, input)
+    if "LastName" in changed:
+        map_last_name(output, input)
+
+    if "CompanyCode" in changed:
+        attributes.pop("company", None)
+        map_company_code(output, input)
+        # As in the full mappers, a status without a company is dropped.
+        if "company" in attributes:
+            map_employment_status(output, input)
+    elif "EmploymentStatus" in changed and "company" in attributes:
+        # Only the status moved: copy the path down to it and keep the
+        # company code and type shared.
+        company = dict(attributes["company"][0]["value"])
+        company.pop("status", None)
+        attributes["company"] = [{**attributes["company"][0], "value": company}]
+        map_employment_status(output, input)
+
+    return output
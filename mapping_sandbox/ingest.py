@@ -0,0 +1,198 @@
+import contextlib
+import json
+import mmap
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Generator, Iterator, Optional, Union
+
+from .base import Mappable
+from .executor import WARMUP_RECORD, Failure, Outcome
+
+# =====================================================================
+# JSONL ingestion: the file is memory-mapped and cut into byte ranges
+# that end on newlines. Each worker process maps the file itself, parses
+# its range and runs the mapper over the records, so the parent only
+# ever touches the range boundaries and the outputs. Nothing is read
+# into memory beyond the ranges in flight.
+# =====================================================================
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+# Either kind of mapper will do. Dicts are expensive to send back from a
+# worker (unpickling thousands of nested containers keeps the parent's
+# garbage collector busy), so a `map_to_json` that hands back bytes lets
+# the parent keep up with many more workers.
+AnyMapper = Union[Mappable, Callable[[dict[str, Any]], bytes]]
+
+
+@dataclass
+class IngestStats:
+    """Running totals for an ingestion, updated as ranges complete."""
+
+    bytes: int = 0
+    records: int = 0
+    failures: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    finished: Optional[float] = None
+
+    @property
+    def seconds(self) -> float:
+        end = self.finished if self.finished is not None else time.perf_counter()
+        return end - self.started
+
+    @property
+    def bytes_per_sec(self) -> float:
+        return self.bytes / self.seconds if self.seconds else 0.0
+
+    @property
+    def records_per_sec(self) -> float:
+        return self.records / self.seconds if self.seconds else 0.0
+
+    def report(self) -> str:
+        return (
+            f"{self.records} records ({self.failures} failed), "
+            f"{self.bytes / 2**20:.1f} MiB in {self.seconds:.2f}s: "
+            f"{self.records_per_sec:,.0f} records/s, "
+            f"{self.bytes_per_sec / 2**20:.1f} MiB/s"
+        )
+
+
+def split(path: PathLike, chunk_bytes: int) -> Iterator[tuple[int, int]]:
+    """Cut a file into byte ranges of roughly `chunk_bytes`, each ending
+    just after a newline (or at the end of the file).
+
+    Args:
+        path (PathLike): the JSONL file
+        chunk_bytes (int): target range size
+
+    Yields:
+        tuple[int, int]: start and end offsets of each range
+    """
+    size = os.path.getsize(path)
+    if not size:
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        start = 0
+        while start < size:
+            newline = m.find(b"\n", min(start + chunk_bytes, size) - 1)
+            end = size if newline == -1 else newline + 1
+            yield start, end
+            start = end
+
+
+_mapper: Optional[AnyMapper] = None
+
+
+def _initialize(mapper: AnyMapper) -> None:
+    global _mapper
+    _mapper = mapper
+    with contextlib.suppress(Exception):
+        mapper(WARMUP_RECORD)
+
+
+# Each worker maps the file once and keeps it for every range it's given.
+_views: dict[str, mmap.mmap] = {}
+
+
+def _view(path: str) -> mmap.mmap:
+    view = _views.get(path)
+    if view is None:
+        with open(path, "rb") as f:
+            view = _views[path] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return view
+
+
+def _map_range(path: str, start: int, end: int) -> tuple[int, list[Any]]:
+    mapper = _mapper
+    assert mapper is not None, "worker was not initialized"
+    outcomes: list[Any] = []
+    offset = start
+    for line in _view(path)[start:end].splitlines(keepends=True):
+        if line.strip():
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                text = line.decode(errors="replace").rstrip("\r\n")
+                outcomes.append(
+                    Failure(offset, f"{type(e).__name__}: {e}", {"line": text})
+                )
+            else:
+                try:
+                    outcomes.append(mapper(record))
+                except Exception as e:
+                    outcomes.append(Failure(offset, f"{type(e).__name__}: {e}", record))
+        offset += len(line)
+    return end - start, outcomes
+
+
+def ingest(
+    path: PathLike,
+    mapper: AnyMapper,
+    workers: Optional[int] = None,
+    chunk_bytes: int = 2**20,
+    ordered: bool = True,
+    stats: Optional[IngestStats] = None,
+) -> Generator[Union[Outcome, bytes], None, None]:
+    """Map every record of a JSONL file across a pool of worker processes.
+
+    As with `executor.map_parallel`, the mapper must be picklable and a
+    record that fails yields a `Failure` in its place; here its `index` is
+    the byte offset of the line in the file, and a line that isn't valid
+    JSON fails with the raw text as `{"line": ...}`. Blank lines are
+    skipped. With `ordered=False` outputs are yielded range by range as
+    workers finish, which keeps a slow range from stalling the rest.
+
+    The mapper can also be a `map_to_json` function, in which case each
+    output is yielded as JSON bytes; that's the one to use for big files.
+
+    Args:
+        path (PathLike): the JSONL file
+        mapper (AnyMapper): the mapper to run in each worker
+        workers (Optional[int]): number of processes; defaults to the CPU count
+        chunk_bytes (int): target size of the range sent to a worker at a time
+        ordered (bool): yield outputs in file order
+        stats (Optional[IngestStats]): updated with throughput as ranges complete
+
+    Yields:
+        Union[Outcome, bytes]: employee info in output format, or a `Failure`
+    """
+    path = os.fspath(Path(path).resolve())
+    workers = workers or os.cpu_count() or 1
+    stats = stats if stats is not None else IngestStats()
+
+    def collect(future: "Future[tuple[int, list[Any]]]") -> list[Any]:
+        size, outcomes = future.result()
+        stats.bytes += size
+        stats.records += len(outcomes)
+        stats.failures += sum(isinstance(o, Failure) for o in outcomes)
+        return outcomes
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_initialize, initargs=(mapper,)
+        ) as pool:
+            # Same back-pressure as map_parallel: a couple of ranges queued per
+            # worker, so memory stays flat however big the file is.
+            pending: deque[Future[tuple[int, list[Any]]]] = deque()
+
+            def drain(keep: int) -> Iterator[Any]:
+                while len(pending) > keep:
+                    if ordered:
+                        yield from collect(pending.popleft())
+                        continue
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        pending.remove(future)
+                        yield from collect(future)
+
+            for start, end in split(path, chunk_bytes):
+                pending.append(pool.submit(_map_range, path, start, end))
+                yield from drain(2 * workers - 1)
+            yield from drain(0)
+    finally:
+        # Also when the caller stops reading early and closes us.
+        stats.finished = time.perf_counter()
@@ -0,0 +1,180 @@
+import threading
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+from .base import BatchMappable, Mappable
+
+# =====================================================================
+# Most of an output document is the same handful of strings and tiny
+# `[{"value": ...}]` lists over and over: the constants from
+# `base_employee`, and CompanyCode and EmploymentStatus, which only take a
+# few distinct values. Interning shares one copy of each across every
+# document instead of allocating it per record, which matters when a big
+# mapped batch is held in memory for a bulk load.
+#
+# Shared means shared: documents from an interned mapper must be treated
+# as read-only, since changing a wrapper in one changes it in all.
+# =====================================================================
+
+
+@dataclass
+class InternInfo:
+    hits: int
+    misses: int
+    overflows: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses + self.overflows
+        return self.hits / lookups if lookups else 0.0
+
+
+class InternTable:
+    """A bounded table of shared values. Once it holds `maxsize` entries,
+    new values are handed back as they are rather than added (and counted
+    as overflows), so a field that turns out not to be low-cardinality
+    can't grow it without bound. Entries are never evicted: they're
+    referenced by documents already handed out.
+
+    Args:
+        maxsize (int): most entries to keep
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = maxsize
+        self._entries: dict[tuple[Any, ...], Any] = {}
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._overflows = 0
+
+    def _share(self, key: tuple[Any, ...], value: Any) -> Any:
+        shared = self._entries.get(key)
+        if shared is not None:
+            self._hits += 1
+            return shared
+        with self._lock:
+            if len(self._entries) >= self.maxsize:
+                self._overflows += 1
+                return value
+            self._misses += 1
+            return self._entries.setdefault(key, value)
+
+    def intern(self, value: str) -> str:
+        """The shared copy of a string.
+
+        Args:
+            value (str): any string
+
+        Returns:
+            str: an equal string, shared if there's room in the table
+        """
+        shared: str = self._share(("str", value), value)
+        return shared
+
+    def wrapped(self, value: Any) -> list[dict[str, Any]]:
+        """The shared `[{"value": value}]` wrapper for a value.
+
+        Args:
+            value (Any): any JSON value
+
+        Returns:
+            list[dict[str, Any]]: an equal wrapper, shared if there's room
+                and `value` is hashable
+        """
+        if type(value) is str:
+            value = self.intern(value)
+        wrapper = [{"value": value}]
+        # Keyed on the type too, so False and 0 get separate wrappers.
+        try:
+            shared: list[dict[str, Any]] = self._share(
+                ("wrapped", type(value), value), wrapper
+            )
+        except TypeError:
+            # Unhashable, e.g. a list: not worth sharing anyway.
+            return wrapper
+        return shared
+
+    def info(self) -> InternInfo:
+        return InternInfo(
+            self._hits,
+            self._misses,
+            self._overflows,
+            len(self._entries),
+            self.maxsize,
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._overflows = 0
+
+
+# Shared by every interned mapper that isn't given a table of its own.
+default_table = InternTable()
+
+
+def intern_employee(
+    output: dict[str, Any], table: InternTable = default_table
+) -> dict[str, Any]:
+    """Swap the low-cardinality parts of an output document for shared
+    copies, in place. Names, ids and timestamps are left alone.
+
+    Args:
+        output (dict[str, Any]): employee info in output format
+        table (InternTable): the table to share values from
+
+    Returns:
+        dict[str, Any]: `output`
+    """
+    output["type"] = table.intern(output["type"])
+    attributes = output["attributes"]
+    id_type = attributes["ids"][0]["value"]
+    id_type["type"] = table.wrapped(id_type["type"][0]["value"])
+    attributes["config_flag"] = table.wrapped(attributes["config_flag"][0]["value"])
+    if "company" in attributes:
+        company = attributes["company"][0]["value"]
+        for key in ("type", "company_code", "status"):
+            if key in company:
+                company[key] = table.wrapped(company[key][0]["value"])
+    metadata = output["metadata"][0]
+    metadata["type"] = table.intern(metadata["type"])
+    return output
+
+
+def interned(mapper: Mappable, table: Optional[InternTable] = None) -> Mappable:
+    """Wrap a mapper so its outputs share their repeated values.
+
+    Args:
+        mapper (Mappable): any mapper
+        table (Optional[InternTable]): defaults to `default_table`
+
+    Returns:
+        Mappable: the interning mapper
+    """
+    shared = default_table if table is None else table
+
+    def interned_mapper(input: dict[str, Any]) -> dict[str, Any]:
+        return intern_employee(mapper(input), shared)
+
+    return interned_mapper
+
+
+def interned_many(
+    map_many: BatchMappable, table: Optional[InternTable] = None
+) -> BatchMappable:
+    """Batch version of `interned`.
+
+    Args:
+        map_many (BatchMappable): any batch mapper
+        table (Optional[InternTable]): defaults to `default_table`
+
+    Returns:
+        BatchMappable: the interning batch mapper
+    """
+    shared = default_table if table is None else table
+
+    def interned_map_many(records: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        return [intern_employee(output, shared) for output in map_many(records)]
+
+    return interned_map_many
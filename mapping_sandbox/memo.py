@@ -0,0 +1,145 @@
+import hashlib
+import json
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from .base import Mappable, freeze
+
+
+@dataclass
+class CacheInfo:
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    maxsize: int
+
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_plain(value: Any) -> bool:
+    # Exact types only: JSON writes a tuple like a list, and a str
+    # subclass like a str, but the mappers would pass either through.
+    if type(value) in _SCALARS:
+        return True
+    if type(value) is list:
+        return all(map(_is_plain, value))
+    if type(value) is dict:
+        return all(type(k) is str and _is_plain(v) for k, v in value.items())
+    return False
+
+
+def canonical_key(input: dict[str, Any]) -> Optional[bytes]:
+    """A digest of the input that doesn't depend on key order. Only
+    inputs made of plain JSON values have one: anything else (a datetime,
+    a tuple) would have to be written as something it isn't, and would
+    share a key with that.
+
+    Args:
+        input (dict[str, Any]): employee info
+
+    Returns:
+        Optional[bytes]: a 128-bit digest of the canonical JSON form of
+            `input`, or None if it isn't plain JSON
+    """
+    if not _is_plain(input):
+        return None
+    text = json.dumps(input, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+class CachedMapper:
+    """Wraps any mapper with a bounded LRU cache, so redelivered and
+    replayed events aren't mapped again. Entries are evicted least
+    recently used first once there are `maxsize` of them, and expire
+    `ttl` seconds after they were mapped, if given.
+
+    Cached outputs can't be poisoned by callers. By default each hit
+    returns a fresh copy, unpickled from the bytes stored at mapping
+    time, which is a fraction of the cost of any of the validating
+    mappers. With `frozen`, hits return one shared read-only view (see
+    `base.freeze`) instead, which costs nothing per hit but has tuples
+    where the output has lists.
+
+    Inputs that aren't plain JSON (see `canonical_key`) are mapped every
+    time, and count as misses.
+
+    Args:
+        mapper (Mappable): the mapper to cache
+        maxsize (int): most entries to keep
+        ttl (Optional[float]): seconds an entry stays valid; forever if None
+        frozen (bool): return shared frozen views instead of copies
+    """
+
+    def __init__(
+        self,
+        mapper: Mappable,
+        maxsize: int = 10_000,
+        ttl: Optional[float] = None,
+        frozen: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.mapper = mapper
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.frozen = frozen
+        self._clock = clock
+        self._entries: OrderedDict[bytes, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def __call__(self, input: dict[str, Any]) -> Any:
+        key = canonical_key(input)
+        if key is None:
+            with self._lock:
+                self._misses += 1
+            return self.mapper(input)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires >= now:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return value if self.frozen else pickle.loads(value)
+                del self._entries[key]
+                self._expirations += 1
+            self._misses += 1
+
+        output = self.mapper(input)
+        if self.frozen:
+            value = output = freeze(output)
+        else:
+            value = pickle.dumps(output, pickle.HIGHEST_PROTOCOL)
+        expires = now + self.ttl if self.ttl is not None else float("inf")
+
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return output
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._expirations,
+                len(self._entries),
+                self.maxsize,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._expirations = 0
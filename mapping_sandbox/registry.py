@@ -0,0 +1,174 @@
+import importlib
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from .base import BatchMappable, Mappable
+
+# =====================================================================
+# Every mapper implementation, by name. Modules are only imported when
+# a mapper is first looked up, so e.g. using "python" never pulls in
+# pydantic or jinja2. Register new mappers here.
+# =====================================================================
+
+
+@dataclass(frozen=True)
+class Entry:
+    module: str
+    mapper: str = "mapper"
+    map_many: str = "map_many"
+    map_to_json: str = "map_to_json"
+
+
+MAPPERS: dict[str, Entry] = {
+    "jinja": Entry("mapping_sandbox.with_jinja"),
+    "pipeline": Entry("mapping_sandbox.with_pipeline"),
+    "pydantic": Entry("mapping_sandbox.with_pydantic"),
+    "pydantic_builder": Entry("mapping_sandbox.with_pydantic_builder"),
+    "pydantic_fast": Entry("mapping_sandbox.with_pydantic_fast"),
+    "pydantic_trusted": Entry(
+        "mapping_sandbox.with_pydantic_fast",
+        mapper="trusted_mapper",
+        map_many="trusted_map_many",
+        map_to_json="trusted_map_to_json",
+    ),
+    "pydantic_pipeline": Entry("mapping_sandbox.with_pydantic_pipeline"),
+    "python": Entry("mapping_sandbox.with_python"),
+    "reduce": Entry("mapping_sandbox.with_reduce"),
+    "spec": Entry("mapping_sandbox.with_spec"),
+}
+
+# Importing any of these makes a short-lived process noticeably slower
+# to start, so only the mappers that need them should pull them in.
+HEAVY_DEPENDENCIES = ("pydantic", "jinja2")
+
+
+def names() -> list[str]:
+    """Names of all registered mappers, without importing any of them.
+
+    Returns:
+        list[str]: the names, sorted
+    """
+    return sorted(MAPPERS)
+
+
+def register(name: str, entry: Entry) -> None:
+    """Add (or replace) a mapper in the registry.
+
+    Args:
+        name (str): the name to look the mapper up by
+        entry (Entry): where to find its functions
+    """
+    MAPPERS[name] = entry
+
+
+def _resolve(name: str, attr: str) -> Any:
+    try:
+        entry = MAPPERS[name]
+    except KeyError:
+        raise KeyError(f"no mapper named {name!r}; try one of {names()}") from None
+    return getattr(importlib.import_module(entry.module), getattr(entry, attr))
+
+
+def get_mapper(name: str) -> Mappable:
+    """Look up a mapper by name, importing its module on first use.
+
+    Args:
+        name (str): a registered name, e.g. "python"
+
+    Returns:
+        Mappable: the mapper
+    """
+    mapper: Mappable = _resolve(name, "mapper")
+    return mapper
+
+
+def get_batch_mapper(name: str) -> BatchMappable:
+    """Look up a mapper's `map_many` by name.
+
+    Args:
+        name (str): a registered name, e.g. "python"
+
+    Returns:
+        BatchMappable: the batch mapper
+    """
+    map_many: BatchMappable = _resolve(name, "map_many")
+    return map_many
+
+
+def get_json_mapper(name: str) -> Callable[[dict[str, Any]], bytes]:
+    """Look up a mapper's `map_to_json` by name.
+
+    Args:
+        name (str): a registered name, e.g. "python"
+
+    Returns:
+        Callable[[dict[str, Any]], bytes]: the JSON mapper
+    """
+    map_to_json: Callable[[dict[str, Any]], bytes] = _resolve(name, "map_to_json")
+    return map_to_json
+
+
+class ImportBudgetError(RuntimeError):
+    pass
+
+
+@dataclass
+class ImportReport:
+    module: str
+    seconds: float
+    heavy: list[str]
+
+
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+print(",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+
+def measure_import(module: str) -> ImportReport:
+    """Import a module in a fresh interpreter and report how long it took
+    and which heavy dependencies it pulled in.
+
+    Args:
+        module (str): dotted module name
+
+    Returns:
+        ImportReport: the measurements
+    """
+    probe = _PROBE.format(module=module, heavy=HEAVY_DEPENDENCIES)
+    result = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    )
+    seconds, heavy = result.stdout.splitlines()
+    return ImportReport(module, float(seconds), heavy.split(",") if heavy else [])
+
+
+def check_import_budget(
+    name: str, budget: float, allow_heavy: bool = False
+) -> ImportReport:
+    """Check that importing a registered mapper stays within budget.
+
+    Args:
+        name (str): a registered name, e.g. "python"
+        budget (float): the most seconds the import may take
+        allow_heavy (bool): whether it may import pydantic or jinja2
+
+    Raises:
+        ImportBudgetError: if the import is over budget or too heavy
+
+    Returns:
+        ImportReport: the measurements
+    """
+    report = measure_import(MAPPERS[name].module)
+    if report.heavy and not allow_heavy:
+        raise ImportBudgetError(f"{name} imports {', '.join(report.heavy)}")
+    if report.seconds > budget:
+        raise ImportBudgetError(
+            f"{name} took {report.seconds:.3f}s to import, budget {budget:.3f}s"
+        )
+    return report
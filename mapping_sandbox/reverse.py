@@ -0,0 +1,125 @@
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from .schema import EmployeeIn, EmployeeOut
+
+# =====================================================================
+# The reverse direction: output-shaped documents (see schema.EmployeeOut)
+# back to EmployeeIn-shaped input dicts.
+# =====================================================================
+
+_MISSING: Any = object()
+
+
+def _company(doc: dict[str, Any]) -> dict[str, Any]:
+    company = doc["attributes"].get("company")
+    return company[0]["value"] if company else {}
+
+
+def _company_code(doc: dict[str, Any]) -> Any:
+    code = _company(doc).get("company_code")
+    return code[0]["value"] if code else _MISSING
+
+
+def _employment_status(doc: dict[str, Any]) -> Any:
+    status = _company(doc).get("status")
+    return status[0]["value"] if status else _MISSING
+
+
+# Reads each EmployeeIn field straight out of an output document. Only
+# the paths a field needs are touched, so extracting e.g. just the
+# employee number never looks at the attributes at all.
+EXTRACTORS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "EventTimestamp": lambda doc: doc["metadata"][0]["update_date"],
+    "EmployeeNumber": lambda doc: doc["metadata"][0]["value"],
+    "FirstName": lambda doc: doc["attributes"]["first_name"],
+    "LastName": lambda doc: doc["attributes"]["last_name"],
+    "CompanyCode": _company_code,
+    "EmploymentStatus": _employment_status,
+}
+
+
+def unmapper(output: dict[str, Any]) -> dict[str, Any]:
+    """Map an output document back to input format, fully validating it
+    against `EmployeeOut` on the way in and `EmployeeIn` on the way out.
+    `CompanyCode` and `EmploymentStatus` are only present if the document
+    has a company block (and, for the status, a status in it).
+
+    Args:
+        output (dict[str, Any]): employee info in output format
+
+    Returns:
+        dict[str, Any]: employee info
+    """
+    employee_out = EmployeeOut.model_validate(output)
+    attributes = employee_out.attributes
+    metadata = employee_out.metadata[0]
+    company = attributes.company[0].value if attributes.company else None
+
+    return EmployeeIn.model_validate(
+        {
+            "EventTimestamp": metadata.update_date,
+            "EmployeeNumber": metadata.value,
+            "FirstName": attributes.first_name,
+            "LastName": attributes.last_name,
+            "CompanyCode": company.company_code[0].value if company else None,
+            "EmploymentStatus": (
+                company.status[0].value if company and company.status else None
+            ),
+        }
+    ).model_dump(by_alias=True, exclude_none=True)
+
+
+def make_unmapper(
+    fields: Optional[Iterable[str]] = None,
+) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    """Build an unvalidated reverse mapper that extracts only `fields`.
+    The documents are assumed to be well formed, e.g. because we wrote
+    them; a required field that's missing raises `KeyError`.
+
+    Args:
+        fields (Optional[Iterable[str]]): EmployeeIn aliases to extract;
+            all of them by default
+
+    Returns:
+        Callable[[dict[str, Any]], dict[str, Any]]: the reverse mapper
+    """
+    names = EXTRACTORS if fields is None else fields
+    extractors = [(field, EXTRACTORS[field]) for field in names]
+
+    def fast_unmapper(output: dict[str, Any]) -> dict[str, Any]:
+        input = {}
+        for field, extract in extractors:
+            value = extract(output)
+            if value is not _MISSING:
+                input[field] = value
+        return input
+
+    return fast_unmapper
+
+
+fast_unmapper = make_unmapper()
+
+
+def unmap_many(
+    outputs: Iterable[dict[str, Any]],
+    fields: Optional[Iterable[str]] = None,
+    validate: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """Reverse map a stream of output documents lazily, one at a time.
+
+    Args:
+        outputs (Iterable[dict[str, Any]]): employee info in output format
+        fields (Optional[Iterable[str]]): EmployeeIn aliases to extract
+            when not validating; all of them by default
+        validate (bool): validate every document with `unmapper`
+
+    Returns:
+        Iterator[dict[str, Any]]: employee info
+    """
+    # Not a generator, so bad arguments raise here rather than on the
+    # first `next()`; `map` is lazy on its own.
+    if validate:
+        if fields is not None:
+            raise ValueError("validation always extracts every field")
+        return map(unmapper, outputs)
+    return map(make_unmapper(fields), outputs)
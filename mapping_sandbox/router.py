@@ -0,0 +1,102 @@
+from typing import Any, Callable, Iterator, Optional
+
+# A handler writes one input field into the output document.
+Handler = Callable[[dict[str, Any], Any], None]
+
+
+class FieldRouter:
+    """Routes input fields to their handlers through a precomputed table.
+
+    The order fields are handled in is worked out once, up front: a field
+    listed in `requires` always comes after the field it depends on, and is
+    skipped entirely when that field isn't handled: when it isn't in the
+    input, or when it was skipped itself for want of its own requirement.
+    Otherwise fields are handled in the order `handlers` lists them.
+    Routing a record then walks this table and looks each field up in the
+    input, so its cost depends on the number of fields handled, not on how
+    many other keys the input carries.
+
+    Args:
+        handlers (dict[str, Handler]): input key -> handler
+        requires (Optional[dict[str, str]]): input key -> the input key it
+            depends on
+    """
+
+    def __init__(
+        self, handlers: dict[str, Handler], requires: Optional[dict[str, str]] = None
+    ) -> None:
+        self.handlers = dict(handlers)
+        self.requires = dict(requires or {})
+        self.keys = frozenset(self.handlers)
+        for key, required in self.requires.items():
+            if key not in self.keys or required not in self.keys:
+                raise ValueError(f"{key!r} requires {required!r}, with no handler")
+        # Only fields something depends on need remembering once handled.
+        depended_on = frozenset(self.requires.values())
+        self._routes = tuple(
+            (key, self.handlers[key], self.requires.get(key), key in depended_on)
+            for key in self._order()
+        )
+
+    def _order(self) -> list[str]:
+        order: list[str] = []
+        visiting: set[str] = set()
+
+        def visit(key: str) -> None:
+            if key in order:
+                return
+            if key in visiting:
+                raise ValueError(f"circular requirement through {key!r}")
+            visiting.add(key)
+            if key in self.requires:
+                visit(self.requires[key])
+            order.append(key)
+
+        for key in self.handlers:
+            visit(key)
+        return order
+
+    def items(self, input: dict[str, Any]) -> Iterator[tuple[str, Any]]:
+        """The fields of `input` that have handlers, in handling order.
+
+        Args:
+            input (dict[str, Any]): employee info
+
+        Yields:
+            tuple[str, Any]: key and value of each field to handle
+        """
+        handled: set[str] = set()
+        for key, _, required, remember in self._routes:
+            if key in input and (required is None or required in handled):
+                if remember:
+                    handled.add(key)
+                yield key, input[key]
+
+    def route(self, output: dict[str, Any], input: dict[str, Any]) -> dict[str, Any]:
+        """Run every applicable handler over `output`.
+
+        Args:
+            output (dict[str, Any]): the document to write into
+            input (dict[str, Any]): employee info
+
+        Returns:
+            dict[str, Any]: `output`
+        """
+        handled: set[str] = set()
+        for key, handler, required, remember in self._routes:
+            if key in input and (required is None or required in handled):
+                if remember:
+                    handled.add(key)
+                handler(output, input[key])
+        return output
+
+    def unknown(self, input: dict[str, Any]) -> set[str]:
+        """The keys of `input` with no handler, in one set difference.
+
+        Args:
+            input (dict[str, Any]): employee info
+
+        Returns:
+            set[str]: the keys that are dropped
+        """
+        return input.keys() - self.keys
@@ -50,3 +50,12 @@ class EmployeeOut(BaseModel):
     type: str = "namespace/employee"
     attributes: Attributes
     metadata: list[Metadata]
+
+
+# Pre-resolved generic specializations. Subscripting `Value[T]` goes through
+# pydantic's parametrization cache on every call, which costs about as much as
+# validating the model itself, so the mappers use these instead.
+StrValue = Value[str]
+BoolValue = Value[bool]
+IdValue = Value[Id]
+CompanyValue = Value[Company]
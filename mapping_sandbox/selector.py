@@ -0,0 +1,123 @@
+import contextlib
+import hashlib
+import json
+import platform
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Iterable, Optional
+
+from . import registry
+from .artifacts import cache_dir, package_version, write_entry
+from .conformance import conforms
+
+
+@dataclass
+class Selection:
+    name: str
+    ops_per_sec: dict[str, float]
+    rejected: list[str]
+    cached: bool = False
+
+
+def workload_shape(sample: list[dict[str, Any]]) -> dict[str, float]:
+    """How often the optional fields appear, rounded so that samples of
+    the same feed map to the same shape.
+
+    Args:
+        sample (list[dict[str, Any]]): employee info
+
+    Returns:
+        dict[str, float]: fraction of records with each optional field
+    """
+    count = len(sample) or 1
+    return {
+        field: round(sum(field in record for record in sample) / count, 1)
+        for field in ("CompanyCode", "EmploymentStatus")
+    }
+
+
+def cache_key(names: list[str], sample: list[dict[str, Any]]) -> str:
+    """The environment and workload a selection depends on, hashed.
+
+    Args:
+        names (list[str]): candidate mapper names
+        sample (list[dict[str, Any]]): employee info
+
+    Returns:
+        str: a hex digest
+    """
+    key = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "pydantic": package_version("pydantic"),
+        "jinja2": package_version("jinja2"),
+        "names": sorted(names),
+        "shape": workload_shape(sample),
+    }
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()[:32]
+
+
+def _ops_per_sec(name: str, sample: list[dict[str, Any]], repeat: int) -> float:
+    mapper = registry.get_mapper(name)
+    for record in sample[:10]:
+        mapper(record)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for record in sample:
+            mapper(record)
+        best = min(best, time.perf_counter() - start)
+    return len(sample) / best if best else float("inf")
+
+
+def select_mapper(
+    sample: Iterable[dict[str, Any]],
+    names: Optional[Iterable[str]] = None,
+    repeat: int = 3,
+    use_cache: bool = True,
+) -> Selection:
+    """Pick the fastest registered mapper for a workload. Every candidate
+    is first checked against the README's reference cases; the ones that
+    pass are timed over `sample` (best of `repeat` runs) and the fastest
+    wins. Records in the sample that a mapper can't handle disqualify it.
+
+    The choice depends on the mix of optional fields and on library
+    versions, so the result is cached on disk keyed by both, along with
+    the Python version and the candidates.
+
+    Args:
+        sample (Iterable[dict[str, Any]]): representative employee info
+        names (Optional[Iterable[str]]): candidates; all registered by default
+        repeat (int): timing runs per mapper
+        use_cache (bool): read and write the on-disk cache
+
+    Returns:
+        Selection: the winner, with every candidate's throughput
+    """
+    sample = list(sample)
+    names = list(names or registry.names())
+    path = cache_dir("selector") / f"{cache_key(names, sample)}.json"
+    if use_cache:
+        # A missing, unreadable, or half-written entry is just a miss.
+        with contextlib.suppress(OSError, ValueError, TypeError):
+            return Selection(**{**json.loads(path.read_text()), "cached": True})
+
+    ops_per_sec: dict[str, float] = {}
+    rejected: list[str] = []
+    for name in names:
+        if not conforms(registry.get_mapper(name)):
+            rejected.append(name)
+            continue
+        try:
+            ops_per_sec[name] = _ops_per_sec(name, sample, repeat)
+        except Exception:
+            rejected.append(name)
+    if not ops_per_sec:
+        raise ValueError(f"no conformant mapper among {names}")
+
+    selection = Selection(
+        max(ops_per_sec, key=ops_per_sec.__getitem__), ops_per_sec, rejected
+    )
+    if use_cache:
+        write_entry(path, json.dumps({**asdict(selection), "cached": False}).encode())
+    return selection
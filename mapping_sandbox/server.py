@@ -0,0 +1,383 @@
+import argparse
+import asyncio
+import contextlib
+import json
+import multiprocessing
+import os
+import signal
+import socket
+from typing import Any, Iterable, Optional
+
+from . import registry
+from .executor import WARMUP_RECORD, chunks
+
+# =====================================================================
+# A long-lived local mapping service, so short-lived producers don't each
+# pay for importing pydantic or jinja2 and compiling templates just to map
+# a handful of records. Clients send newline-delimited JSON inputs over a
+# Unix socket (or TCP on localhost) and get one line back per input, in
+# order: the output document, or {"error": "..."}.
+#
+# Lines from every connection a worker has open are pooled into micro-
+# batches for the mapper's `map_many`. Workers are separate processes
+# sharing one listening socket, each with its own warm mapper.
+# =====================================================================
+
+_COMPACT = (",", ":")
+
+
+def _error(e: Exception) -> bytes:
+    return json.dumps(
+        {"error": f"{type(e).__name__}: {e}"}, separators=_COMPACT
+    ).encode()
+
+
+def _check_batching(max_batch: int, max_delay: float) -> None:
+    if max_batch < 1:
+        raise ValueError("max_batch must be at least 1")
+    if max_delay < 0:
+        raise ValueError("max_delay must not be negative")
+
+
+class Batcher:
+    """Collects inputs into batches, mapped once `max_batch` are waiting or
+    `max_delay` seconds after the first of them arrived, whichever comes
+    first. Must be used from within a running event loop.
+
+    Args:
+        name (str): a registered mapper name
+        max_batch (int): most inputs per batch
+        max_delay (float): longest an input waits for its batch to fill
+
+    Raises:
+        ValueError: if `max_batch` is below 1 or `max_delay` is negative
+    """
+
+    def __init__(self, name: str, max_batch: int = 256, max_delay: float = 0.002):
+        _check_batching(max_batch, max_delay)
+        # Imported here rather than at the top: clients import this module
+        # for `map_remote`, and shouldn't pay for pydantic.
+        from .validation import check
+
+        self.mapper = registry.get_mapper(name)
+        self.map_many = registry.get_batch_mapper(name)
+        self.check = check
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.batches = 0
+        self._records: list[dict[str, Any]] = []
+        self._futures: list[asyncio.Future[bytes]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def warm_up(self) -> None:
+        """Map a record through both paths, so templates are compiled and
+        models built before the first client shows up."""
+        self.mapper(dict(WARMUP_RECORD))
+        self.map_many([dict(WARMUP_RECORD)])
+
+    def submit(self, line: bytes) -> "asyncio.Future[bytes]":
+        """Queue one line of input for mapping.
+
+        Args:
+            line (bytes): an input record, as JSON
+
+        Returns:
+            asyncio.Future[bytes]: resolves to the response line, without
+                the newline
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[bytes] = loop.create_future()
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            future.set_result(_error(e))
+            return future
+        self._records.append(record)
+        self._futures.append(future)
+        if len(self._records) >= self.max_batch:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self.flush)
+        return future
+
+    def flush(self) -> None:
+        """Map whatever is waiting now."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        records, futures = self._records, self._futures
+        self._records, self._futures = [], []
+        if not records:
+            return
+        self.batches += 1
+        for future, response in zip(futures, self._map(records)):
+            if not future.cancelled():
+                future.set_result(response)
+
+    def _map(self, records: list[dict[str, Any]]) -> list[bytes]:
+        # One bad record would fail the whole `map_many` call and throw
+        # away what it had mapped, so records that don't pass the schema
+        # check are kept out of the batch and mapped on their own. The
+        # mapper still has the last word on them: a lenient one may map
+        # what the check turns away.
+        responses: list[bytes] = [b""] * len(records)
+        batch: list[dict[str, Any]] = []
+        positions: list[int] = []
+        for position, record in enumerate(records):
+            if self.check(record):
+                responses[position] = self._map_one(record)
+            else:
+                batch.append(record)
+                positions.append(position)
+        if not batch:
+            return responses
+        try:
+            outputs = [
+                json.dumps(o, separators=_COMPACT).encode()
+                for o in self.map_many(batch)
+            ]
+        except Exception:
+            # A mapper stricter than the check. Rare enough to just map
+            # the batch again, one at a time, so only the culprit fails.
+            outputs = [self._map_one(record) for record in batch]
+        for position, output in zip(positions, outputs):
+            responses[position] = output
+        return responses
+
+    def _map_one(self, record: dict[str, Any]) -> bytes:
+        try:
+            return json.dumps(self.mapper(record), separators=_COMPACT).encode()
+        except Exception as e:
+            return _error(e)
+
+
+async def _handle(
+    batcher: Batcher, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    # Responses go out in request order, while later requests are still
+    # being read and batched.
+    pending: asyncio.Queue[Optional[asyncio.Future[bytes]]] = asyncio.Queue(
+        4 * batcher.max_batch
+    )
+
+    async def respond() -> None:
+        while (future := await pending.get()) is not None:
+            writer.write(await future + b"\n")
+            if pending.empty():
+                await writer.drain()
+
+    responder = asyncio.ensure_future(respond())
+    try:
+        async for line in reader:
+            if line.strip():
+                await pending.put(batcher.submit(line))
+        await pending.put(None)
+        await responder
+    finally:
+        responder.cancel()
+        writer.close()
+
+
+async def _serve(
+    sock: socket.socket, name: str, max_batch: int, max_delay: float
+) -> None:
+    batcher = Batcher(name, max_batch, max_delay)
+    batcher.warm_up()
+
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        with contextlib.suppress(ConnectionError):
+            await _handle(batcher, reader, writer)
+
+    limit = 2**20
+    if sock.family == socket.AF_UNIX:
+        server = await asyncio.start_unix_server(handle, sock=sock, limit=limit)
+    else:
+        server = await asyncio.start_server(handle, sock=sock, limit=limit)
+    async with server:
+        await server.serve_forever()
+
+
+def _worker(sock: socket.socket, name: str, max_batch: int, max_delay: float) -> None:
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    asyncio.run(_serve(sock, name, max_batch, max_delay))
+
+
+class Server:
+    """Runs a registered mapper behind a local socket, in `workers`
+    processes that all accept connections from the same listening socket.
+
+    Args:
+        mapper (str): a registered mapper name
+        path (Optional[str]): a Unix socket path; TCP if None
+        host (str): TCP host
+        port (int): TCP port; 0 picks a free one, see `address`
+        workers (int): number of worker processes
+        max_batch (int): most inputs per batch
+        max_delay (float): longest an input waits for its batch to fill
+
+    Raises:
+        ValueError: if `workers` or `max_batch` is below 1, or `max_delay`
+            is negative
+    """
+
+    def __init__(
+        self,
+        mapper: str = "python",
+        path: Optional[str] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        workers: int = 1,
+        max_batch: int = 256,
+        max_delay: float = 0.002,
+    ) -> None:
+        registry.get_mapper(mapper)  # fail early on an unknown name
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        _check_batching(max_batch, max_delay)
+        self.mapper = mapper
+        self.path = path
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._sock: Optional[socket.socket] = None
+        self._processes: list[multiprocessing.process.BaseProcess] = []
+
+    @property
+    def address(self) -> Any:
+        """Where clients connect: the socket path, or (host, port)."""
+        assert self._sock is not None, "server is not started"
+        return self._sock.getsockname()
+
+    def start(self) -> "Server":
+        """Bind the socket and start the workers. Returns once they're
+        started, not necessarily warm: connections made before then wait
+        in the listen backlog. Does nothing if already started."""
+        if self._sock is not None:
+            return self
+        if self.path is not None:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.path)
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.bind(self.path)
+        else:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind((self.host, self.port))
+        sock.listen(1024)
+        self._sock = sock
+        args = (sock, self.mapper, self.max_batch, self.max_delay)
+        for _ in range(self.workers):
+            process = multiprocessing.Process(target=_worker, args=args, daemon=True)
+            process.start()
+            self._processes.append(process)
+        return self
+
+    def stop(self) -> None:
+        """Stop the workers and close the socket."""
+        for process in self._processes:
+            process.terminate()
+        for process in self._processes:
+            process.join()
+        self._processes.clear()
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+            if self.path is not None:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(self.path)
+
+    def serve_forever(self) -> None:
+        """Start, if not started yet, and run until interrupted."""
+        self.start()
+        try:
+            for process in self._processes:
+                process.join()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def __enter__(self) -> "Server":
+        return self.start()
+
+    def __exit__(self, *_: Any) -> None:
+        self.stop()
+
+
+def connect(address: Any) -> socket.socket:
+    """Open a connection to a server.
+
+    Args:
+        address (Any): a Unix socket path, or (host, port)
+
+    Returns:
+        socket.socket: the connection
+    """
+    if isinstance(address, str):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(address)
+        return sock
+    return socket.create_connection(address)
+
+
+def map_remote(
+    address: Any, records: Iterable[dict[str, Any]], chunk_size: int = 1000
+) -> list[dict[str, Any]]:
+    """Map records on a server. Inputs are sent `chunk_size` at a time,
+    and each chunk's responses read back before the next is sent, so
+    neither side's socket buffers fill up however many records there are.
+
+    Args:
+        address (Any): a Unix socket path, or (host, port)
+        records (Iterable[dict[str, Any]]): employee info
+        chunk_size (int): records to send at a time
+
+    Returns:
+        list[dict[str, Any]]: employee info in output format, or
+            {"error": ...} for each record that couldn't be mapped
+    """
+    outputs: list[dict[str, Any]] = []
+    with connect(address) as sock, sock.makefile("rb") as responses:
+        for _, chunk in chunks(records, chunk_size):
+            sock.sendall(b"".join(json.dumps(r).encode() + b"\n" for r in chunk))
+            outputs.extend(json.loads(responses.readline()) for _ in chunk)
+    return outputs
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m mapping_sandbox.server",
+        description="Serve a registered mapper over newline-delimited JSON.",
+    )
+    parser.add_argument("-m", "--mapper", default="python", choices=registry.names())
+    parser.add_argument("-s", "--socket", help="Unix socket path; TCP if omitted")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("-p", "--port", type=int, default=8765)
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--max-batch", type=int, default=256)
+    parser.add_argument("--max-delay", type=float, default=0.002)
+    args = parser.parse_args(argv)
+
+    server = Server(
+        args.mapper,
+        args.socket,
+        args.host,
+        args.port,
+        args.workers,
+        args.max_batch,
+        args.max_delay,
+    )
+    server.start()
+    print(
+        f"serving {args.mapper} on {server.address} with {args.workers} workers",
+        flush=True,
+    )
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
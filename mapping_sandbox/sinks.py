@@ -0,0 +1,272 @@
+import gzip
+import itertools
+import json
+import os
+import uuid
+import zlib
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Optional, Union
+
+from .compact import CompactEmployee
+from .streaming import Sink
+
+# =====================================================================
+# Writes mapped documents out as JSON lines for bulk loads. Outputs are
+# collected in memory per file and written in large blocks, so the
+# filesystem (and the compressor) sees a few big writes rather than one
+# per record. Each file is written under a temporary name and renamed
+# into place when it's complete: readers only ever see whole files.
+# =====================================================================
+
+Output = Union[dict[str, Any], CompactEmployee, bytes]
+
+SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+
+def _compressor(
+    raw: BinaryIO, compression: Optional[str], level: Optional[int]
+) -> BinaryIO:
+    if compression is None:
+        return raw
+    if compression == "gzip":
+        # mtime=0 keeps the output byte-for-byte reproducible.
+        return gzip.GzipFile(  # type: ignore[return-value]
+            fileobj=raw, mode="wb", compresslevel=6 if level is None else level, mtime=0
+        )
+    if compression == "zstd":
+        try:
+            import zstandard  # type: ignore[import-not-found]
+        except ImportError as e:
+            raise ImportError("zstd compression needs the zstandard package") from e
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+        return compressor.stream_writer(raw, closefd=False)  # type: ignore[no-any-return]
+    raise ValueError(f"unknown compression {compression!r}")
+
+
+def employee_id(output: Output) -> str:
+    """The employee id of an output document, `metadata[0].value`.
+
+    Args:
+        output (Output): employee info in output format, in any `Output` form
+
+    Returns:
+        str: the employee id
+    """
+    if isinstance(output, CompactEmployee):
+        return str(output.employee_number)
+    document = json.loads(output) if isinstance(output, bytes) else output
+    return str(document["metadata"][0]["value"])
+
+
+class _File:
+    def __init__(
+        self, final: Path, compression: Optional[str], level: Optional[int]
+    ) -> None:
+        self.final = final
+        self.temporary = final.with_name(f".{final.name}.tmp")
+        # Closed by commit or abort, which outlive any with block here.
+        self.raw: BinaryIO = open(self.temporary, "wb")  # noqa: SIM115
+        try:
+            self.stream = _compressor(self.raw, compression, level)
+        except Exception:
+            self.abort()
+            raise
+        self.buffer: list[bytes] = []
+        self.buffered = 0
+        self.written = 0
+
+    def flush(self) -> None:
+        if self.buffer:
+            self.stream.write(b"".join(self.buffer))
+            self.buffer.clear()
+            self.buffered = 0
+
+    def commit(self) -> None:
+        self.flush()
+        if self.stream is not self.raw:
+            self.stream.close()  # writes the compressor's trailer
+        # On disk before it's renamed, so a crash can't leave a complete
+        # name pointing at an incomplete file.
+        self.raw.flush()
+        os.fsync(self.raw.fileno())
+        self.raw.close()
+        os.replace(self.temporary, self.final)
+
+    def abort(self) -> None:
+        self.raw.close()
+        self.temporary.unlink(missing_ok=True)
+
+
+class FileSink:
+    """Writes employee info in output format to JSON lines files.
+
+    With `partitions` > 1, outputs are spread across that many files by a
+    stable hash of their employee id, so every document for one employee
+    lands in the same file. With `max_bytes`, a file is closed and a new
+    one started once that many (uncompressed) bytes have gone into it.
+    Files are named `<prefix>-<partition>-<part>-<token>.jsonl[.gz|.zst]`,
+    where `token` is random per sink, so several sinks can write to one
+    directory with the same prefix without clobbering each other's files.
+
+    Outputs can be dicts, `CompactEmployee`s, or the JSON bytes a
+    `map_to_json` returns; bytes are written as is. Finding the employee
+    id of JSON bytes means parsing them, so when partitioning those, pass
+    the inputs they were mapped from to `write_many` (or the id to
+    `write`) and the id is read from there instead. Nothing is visible in
+    `directory` until a file is committed: by rolling over, or by `close`.
+    Leaving a `with` block on an exception throws away the files still
+    being written instead.
+
+    Args:
+        directory (Union[str, os.PathLike[str]]): where to write the files
+        prefix (str): file name prefix
+        partitions (int): number of files to hash outputs across
+        max_bytes (Optional[int]): roll over to a new file past this size
+        compression (Optional[str]): None, "gzip" or "zstd"
+        level (Optional[int]): compression level; the codec's default if None
+        buffer_size (int): bytes to collect per file before writing them
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, "os.PathLike[str]"],
+        prefix: str = "employees",
+        partitions: int = 1,
+        max_bytes: Optional[int] = None,
+        compression: Optional[str] = None,
+        level: Optional[int] = None,
+        buffer_size: int = 2**20,
+    ) -> None:
+        if compression not in SUFFIXES:
+            raise ValueError(f"unknown compression {compression!r}")
+        if partitions < 1:
+            raise ValueError("partitions must be at least 1")
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self.partitions = partitions
+        self.max_bytes = max_bytes
+        self.compression = compression
+        self.level = level
+        self.buffer_size = buffer_size
+        self.paths: list[Path] = []
+        self.records = 0
+        self._files: dict[int, _File] = {}
+        self.token = uuid.uuid4().hex[:8]
+        self._parts = [0] * partitions
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _file(self, partition: int) -> _File:
+        file = self._files.get(partition)
+        if file is None:
+            suffix = ".jsonl" + SUFFIXES[self.compression]
+            part = self._parts[partition]
+            name = f"{self.prefix}-{partition:03d}-{part:04d}-{self.token}"
+            final = self.directory / (name + suffix)
+            self._parts[partition] += 1
+            file = _File(final, self.compression, self.level)
+            self._files[partition] = file
+        return file
+
+    def _commit(self, partition: int) -> None:
+        file = self._files.pop(partition)
+        file.commit()
+        self.paths.append(file.final)
+
+    def write(self, output: Output, key: Optional[str] = None) -> None:
+        """Write one output.
+
+        Args:
+            output (Output): employee info in output format, in any `Output` form
+            key (Optional[str]): the employee id, if the caller has it to
+                hand; saves parsing JSON outputs to find it
+        """
+        if self.partitions == 1:
+            partition = 0
+        else:
+            key = employee_id(output) if key is None else key
+            partition = zlib.crc32(key.encode()) % self.partitions
+        if isinstance(output, bytes):
+            line = output + b"\n"
+        elif isinstance(output, CompactEmployee):
+            line = output.to_json() + b"\n"
+        else:
+            line = json.dumps(output, separators=(",", ":")).encode() + b"\n"
+
+        file = self._file(partition)
+        file.buffer.append(line)
+        file.buffered += len(line)
+        file.written += len(line)
+        self.records += 1
+        if file.buffered >= self.buffer_size:
+            file.flush()
+        if self.max_bytes is not None and file.written >= self.max_bytes:
+            self._commit(partition)
+
+    def write_many(
+        self,
+        outputs: Iterable[Output],
+        inputs: Optional[Iterable[dict[str, Any]]] = None,
+    ) -> None:
+        """Write a batch of outputs, e.g. what a `map_many` returns.
+
+        Args:
+            outputs (Iterable[Output]): employee info in output format
+            inputs (Optional[Iterable[dict[str, Any]]]): the employee info
+                the outputs were mapped from, one per output and in the
+                same order; outputs are then partitioned on its
+                EmployeeNumber
+
+        Raises:
+            ValueError: if `inputs` and `outputs` differ in length, e.g.
+                because a validator dropped some inputs. The outputs
+                before the mismatch have been written by then.
+        """
+        if inputs is None:
+            for output in outputs:
+                self.write(output)
+            return
+        # zip(strict=True) is 3.10+.
+        done: Any = object()
+        for output, input in itertools.zip_longest(outputs, inputs, fillvalue=done):
+            if output is done or input is done:
+                raise ValueError("outputs and inputs differ in length")
+            self.write(output, str(input["EmployeeNumber"]))
+
+    def as_async(self) -> Sink:
+        """An adapter for `streaming.stream`. Writes only touch the buffer
+        until it fills, so they're cheap enough to run on the event loop.
+
+        Returns:
+            Sink: awaited once per output
+        """
+
+        async def write(output: dict[str, Any]) -> None:
+            self.write(output)
+
+        return write
+
+    def close(self) -> list[Path]:
+        """Commit every open file.
+
+        Returns:
+            list[Path]: every file this sink has committed, in order
+        """
+        for partition in sorted(self._files):
+            self._commit(partition)
+        return self.paths
+
+    def abort(self) -> None:
+        """Throw away every file still being written. Files already
+        committed are left alone."""
+        for file in self._files.values():
+            file.abort()
+        self._files.clear()
+
+    def __enter__(self) -> "FileSink":
+        return self
+
+    def __exit__(self, exc_type: Any, *_: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
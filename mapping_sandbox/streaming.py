@@ -0,0 +1,92 @@
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, AsyncIterable, Awaitable, Callable, Optional
+
+from .base import Mappable
+
+Sink = Callable[[dict[str, Any]], Awaitable[None]]
+
+# Marks the end of a queue; one is sent per consumer.
+_DONE: Any = object()
+
+
+async def stream(
+    source: AsyncIterable[dict[str, Any]],
+    mapper: Mappable,
+    sink: Sink,
+    workers: int = 4,
+    maxsize: int = 100,
+    executor: Optional[Executor] = None,
+) -> int:
+    """Map an async stream of inputs into an async sink.
+
+    Records flow source -> input queue -> `workers` mapping tasks -> output
+    queue -> sink. Both queues are bounded by `maxsize`, so when the sink
+    falls behind the workers block on the output queue, the source blocks
+    on the input queue, and memory stays flat however long the stream is.
+
+    Mapping is CPU-bound, so running a mapper on the event loop stalls
+    everything else on it. Pass an `executor` (a `ProcessPoolExecutor` for
+    real parallelism) to run each mapping call there instead; the mapper
+    must then be picklable, which module-level mapper functions are.
+
+    Output order matches input order only with a single worker.
+
+    Args:
+        source (AsyncIterable[dict[str, Any]]): employee info
+        mapper (Mappable): any mapper
+        sink (Sink): awaited once per output, employee info in output format
+        workers (int): concurrent mapping tasks
+        maxsize (int): capacity of each queue
+        executor (Optional[Executor]): where to run the mapper, if not inline
+
+    Returns:
+        int: number of records delivered to the sink
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if maxsize < 1:
+        raise ValueError("maxsize must be at least 1")
+    loop = asyncio.get_running_loop()
+    inputs: asyncio.Queue[Any] = asyncio.Queue(maxsize)
+    outputs: asyncio.Queue[Any] = asyncio.Queue(maxsize)
+    delivered = 0
+
+    async def produce() -> None:
+        async for record in source:
+            await inputs.put(record)
+        for _ in range(workers):
+            await inputs.put(_DONE)
+
+    async def work() -> None:
+        while (record := await inputs.get()) is not _DONE:
+            if executor is None:
+                output = mapper(record)
+            else:
+                output = await loop.run_in_executor(executor, mapper, record)
+            await outputs.put(output)
+        await outputs.put(_DONE)
+
+    async def consume() -> None:
+        nonlocal delivered
+        remaining = workers
+        while remaining:
+            output = await outputs.get()
+            if output is _DONE:
+                remaining -= 1
+                continue
+            await sink(output)
+            delivered += 1
+
+    tasks = [
+        asyncio.ensure_future(task)
+        for task in [produce(), consume(), *(work() for _ in range(workers))]
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        # If any stage failed, stop the rest rather than leaving them
+        # blocked on a queue forever.
+        for task in tasks:
+            task.cancel()
+    return delivered
@@ -0,0 +1,141 @@
+import contextlib
+import json
+import threading
+from json.encoder import encode_basestring_ascii
+from typing import Any, Iterable, Optional
+
+from jinja2 import Environment, FileSystemBytecodeCache, PackageLoader, Template
+
+from .artifacts import cache_dir, package_version
+
+# =====================================================================
+# A process-wide template engine. Templates are compiled once and kept
+# in a registry; the compiled bytecode is also written to disk so that
+# a fresh process can skip Jinja's parse/compile step entirely.
+# =====================================================================
+
+_lock = threading.Lock()
+_env: Optional[Environment] = None
+_templates: dict[str, Template] = {}
+
+
+def _json_escape(value: Any) -> str:
+    # Templates here render JSON with every `{{ }}` slot inside a string
+    # literal, so each value is escaped as the inside of a JSON string.
+    return encode_basestring_ascii(str(value))[1:-1]
+
+
+def environment() -> Environment:
+    """The shared Jinja environment, created on first use. Auto-reload is
+    off: checking template mtimes on every lookup is exactly the per-call
+    cost we're trying to avoid. Use `is_stale` and `reload` instead.
+
+    Returns:
+        Environment: the process-wide environment
+    """
+    global _env
+    with _lock:
+        if _env is None:
+            # Jinja keys cached bytecode on the template source only, but
+            # `finalize` is compiled into it, so tag our entries to keep
+            # them apart from any compiled without it. Tag them with the
+            # Jinja version too, since that's what compiled it.
+            bytecode_cache: Optional[FileSystemBytecodeCache] = None
+            directory = cache_dir("jinja")
+            # Like `artifacts`, an unwritable cache just means compiling
+            # templates afresh in every process.
+            with contextlib.suppress(OSError):
+                directory.mkdir(parents=True, exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(
+                    str(directory),
+                    f"__mapping_sandbox_json_{package_version('jinja2')}_%s.cache",
+                )
+            _env = Environment(
+                loader=PackageLoader("mapping_sandbox"),
+                bytecode_cache=bytecode_cache,
+                auto_reload=False,
+                finalize=_json_escape,
+            )
+        return _env
+
+
+def get_template(name: str) -> Template:
+    """Look up a compiled template, compiling it on first use.
+
+    Args:
+        name (str): template name, relative to the package templates
+
+    Returns:
+        Template: the compiled template
+    """
+    template = _templates.get(name)
+    if template is None:
+        template = environment().get_template(name)
+        with _lock:
+            template = _templates.setdefault(name, template)
+    return template
+
+
+def is_stale(name: str) -> bool:
+    """Whether a registered template's source has changed on disk since it
+    was compiled. Templates that haven't been compiled yet aren't stale.
+
+    Args:
+        name (str): template name
+
+    Returns:
+        bool: True if the template needs to be reloaded
+    """
+    template = _templates.get(name)
+    return template is not None and not template.is_up_to_date
+
+
+def reload(name: str) -> Template:
+    """Drop a template from the registry and compile it again.
+
+    Args:
+        name (str): template name
+
+    Returns:
+        Template: the freshly compiled template
+    """
+    with _lock:
+        _templates.pop(name, None)
+    environment().cache.clear()  # type: ignore[union-attr]
+    return get_template(name)
+
+
+def clear() -> None:
+    """Forget the environment and every compiled template. The on-disk
+    bytecode cache is left alone."""
+    global _env
+    with _lock:
+        _env = None
+        _templates.clear()
+
+
+def render_batch(name: str, records: Iterable[dict[str, Any]]) -> str:
+    """Render a template once per record, joined into one JSON array.
+
+    Args:
+        name (str): name of a template that renders a single JSON value
+        records (Iterable[dict[str, Any]]): template contexts
+
+    Returns:
+        str: a JSON array with one element per record
+    """
+    template = get_template(name)
+    return "[" + ",".join(template.render(**record) for record in records) + "]"
+
+
+def map_batch(name: str, records: Iterable[dict[str, Any]]) -> list[Any]:
+    """Render a whole batch and parse it with a single `json.loads`.
+
+    Args:
+        name (str): name of a template that renders a single JSON value
+        records (Iterable[dict[str, Any]]): template contexts
+
+    Returns:
+        list[Any]: the parsed outputs, one per record
+    """
+    return json.loads(render_batch(name, records))
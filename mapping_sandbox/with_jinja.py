@@ -1,7 +1,7 @@
 import json
-from typing import Any
+from typing import Any, Iterable
 
-from jinja2 import Environment, PackageLoader
+from .templating import get_template, map_batch
 
 
 def mapper(input: dict[str, Any]) -> dict[str, Any]:
@@ -21,7 +21,31 @@ def mapper(input: dict[str, Any]) -> dict[str, Any]:
     Returns:
         dict[str, Any]: employee info in output format
     """
-    env = Environment(loader=PackageLoader("mapping_sandbox"))
-    template = env.get_template("employee.json")
-    return json.loads(template.render(**input))
+    return json.loads(get_template("employee.json").render(**input))
     # LET'S GOOOOOOOOOOOO
+
+
+def map_to_json(input: dict[str, Any]) -> bytes:
+    """JSON version of `mapper`. The template already renders JSON, so
+    this just skips the `json.loads`.
+
+    Args:
+        input (dict[str, Any]): employee info
+
+    Returns:
+        bytes: employee info in output format, as UTF-8 JSON
+    """
+    return get_template("employee.json").render(**input).encode()
+
+
+def map_many(records: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Batch version of `mapper`. The whole batch is rendered into a
+    single JSON array, so it's parsed once rather than once per record.
+
+    Args:
+        records (Iterable[dict[str, Any]]): employee info
+
+    Returns:
+        list[dict[str, Any]]: employee info in output format
+    """
+    return map_batch("employee.json", records)
@@ -1,8 +1,8 @@
-import copy
-from typing import Any
+from typing import Any, Iterable
 
-from .base import base_employee
-from .functools import pipeline
+from . import encoding
+from .base import new_employee
+from .functools import Pipeline
 
 
 def mapper(input: dict[str, Any]) -> dict[str, Any]:
@@ -30,7 +30,7 @@ def mapper(input: dict[str, Any]) -> dict[str, Any]:
     Returns:
         dict[str, Any]: employee info in output format
     """
-    initial_value = copy.deepcopy(base_employee)
+    initial_value = new_employee()
 
     # Editorial: IF Python had a |> pipe operator, this code would be
     # SO much nicer.
@@ -43,18 +43,32 @@ def mapper(input: dict[str, Any]) -> dict[str, Any]:
     #    |> map_company_code(input)
     #    |> map_employment_status(input)
 
-    return pipeline(
-        initial_value,
-        [
-            map_event_timestamp,
-            map_employee_number,
-            map_first_name,
-            map_last_name,
-            map_company_code,
-            map_employment_status,
-        ],
-        curried_args=[input],
-    )
+    return employee_pipeline(initial_value, input)
+
+
+def map_to_json(input: dict[str, Any]) -> bytes:
+    """JSON version of `mapper`: writes the output document straight to
+    JSON, without building the dict first.
+
+    Args:
+        input (dict[str, Any]): employee info
+
+    Returns:
+        bytes: employee info in output format, as UTF-8 JSON
+    """
+    return encoding.map_to_json(input)
+
+
+def map_many(records: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Batch version of `mapper`.
+
+    Args:
+        records (Iterable[dict[str, Any]]): employee info
+
+    Returns:
+        list[dict[str, Any]]: employee info in output format
+    """
+    return [employee_pipeline(new_employee(), input) for input in records]
 
 
 def map_event_timestamp(
@@ -105,3 +119,15 @@ def map_employment_status(
         {"value": input["EmploymentStatus"]}
     ]
     return output
+
+
+employee_pipeline: Pipeline[dict[str, Any]] = Pipeline(
+    [
+        map_event_timestamp,
+        map_employee_number,
+        map_first_name,
+        map_last_name,
+        map_company_code,
+        map_employment_status,
+    ]
+)
@@ -1,6 +1,18 @@
-from typing import Any
+from typing import Any, Iterable
 
-from .schema import Attributes, Company, EmployeeIn, EmployeeOut, Id, Metadata, Value
+from .schema import (  # noqa: F401 - Value is re-exported for the schema tests
+    Attributes,
+    BoolValue,
+    Company,
+    CompanyValue,
+    EmployeeIn,
+    EmployeeOut,
+    Id,
+    IdValue,
+    Metadata,
+    StrValue,
+    Value,
+)
 
 
 def mapper(input: dict[str, Any]) -> dict[str, Any]:
@@ -17,29 +29,46 @@ def mapper(input: dict[str, Any]) -> dict[str, Any]:
     Returns:
         dict[str, Any]: employee info in output format
     """
+    return build_employee(input).model_dump(exclude_none=True)
+
+
+def map_to_json(input: dict[str, Any]) -> bytes:
+    """JSON version of `mapper`: pydantic serializes the model tree
+    straight to JSON without going through a dict.
+
+    Args:
+        input (dict[str, Any]): employee info
+
+    Returns:
+        bytes: employee info in output format, as UTF-8 JSON
+    """
+    return build_employee(input).model_dump_json(exclude_none=True).encode()
+
+
+def build_employee(input: dict[str, Any]) -> EmployeeOut:
     employee_in = EmployeeIn(**input)
 
     attributes = Attributes(
         first_name=employee_in.first_name,
         last_name=employee_in.last_name,
         ids=[
-            Value[Id](value=Id(type=[Value[str](value="hr_id")])),
-            Value[Id](value=Id(id=employee_in.employee_number)),
+            IdValue(value=Id(type=[StrValue(value="hr_id")])),
+            IdValue(value=Id(id=employee_in.employee_number)),
         ],
-        config_flag=[Value[bool](value=False)],
+        config_flag=[BoolValue(value=False)],
     )
     if employee_in.company_code is not None:
         attributes.company = [
-            Value[Company](
-                value=Company(company_code=[Value[str](value=employee_in.company_code)])
+            CompanyValue(
+                value=Company(company_code=[StrValue(value=employee_in.company_code)])
             )
         ]
         if employee_in.employment_status is not None:
             attributes.company[0].value.status = [
-                Value[str](value=employee_in.employment_status)
+                StrValue(value=employee_in.employment_status)
             ]
 
-    employee_out = EmployeeOut(
+    return EmployeeOut(
         attributes=attributes,
         metadata=[
             Metadata(
@@ -49,4 +78,16 @@ def mapper(input: dict[str, Any]) -> dict[str, Any]:
         ],
     )
 
-    return employee_out.model_dump(exclude_none=True)
+
+def map_many(records: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Batch version of `mapper`. There's no per-call setup left to hoist
+    now that the generic specializations are resolved at import time, so
+    this simply maps each record in turn.
+
+    Args:
+        records (Iterable[dict[str, Any]]): employee info
+
+    Returns:
+        list[dict[str, Any]]: employee info in output format
+    """
+    return [mapper(input) for input in records]
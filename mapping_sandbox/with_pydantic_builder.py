@@ -1,7 +1,19 @@
-from typing import Any, Optional, TypeVar
+from typing import Any, Iterable, Optional, TypeVar
 
 from .base import base_employee
-from .schema import Attributes, Company, EmployeeIn, EmployeeOut, Id, Metadata, Value
+from .schema import (
+    Attributes,
+    BoolValue,
+    Company,
+    CompanyValue,
+    EmployeeIn,
+    EmployeeOut,
+    Id,
+    IdValue,
+    Metadata,
+    StrValue,
+    Value,
+)
 
 T = TypeVar("T")
 
@@ -20,13 +32,49 @@ def mapper(input: dict[str, Any]) -> dict[str, Any]:
     Returns:
         dict[str, Any]: employee info in output format
     """
-    employee_in = EmployeeIn(**input)
+    employee_out = build_employee(EmployeeOut(**base_employee), EmployeeIn(**input))
+    return employee_out.model_dump(exclude_none=True)
+
+
+def map_to_json(input: dict[str, Any]) -> bytes:
+    """JSON version of `mapper`: pydantic serializes the model tree
+    straight to JSON without going through a dict.
+
+    Args:
+        input (dict[str, Any]): employee info
+
+    Returns:
+        bytes: employee info in output format, as UTF-8 JSON
+    """
+    employee_out = build_employee(EmployeeOut(**base_employee), EmployeeIn(**input))
+    return employee_out.model_dump_json(exclude_none=True).encode()
+
+
+def map_many(records: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Batch version of `mapper`. `base_employee` is validated into an
+    `EmployeeOut` once per batch; each record starts from a shallow copy of
+    it, which is safe because the builders replace, rather than mutate, the
+    attributes and metadata.
 
-    employee_out = EmployeeOut(**base_employee)
+    Args:
+        records (Iterable[dict[str, Any]]): employee info
+
+    Returns:
+        list[dict[str, Any]]: employee info in output format
+    """
+    base = EmployeeOut(**base_employee)
+    return [
+        build_employee(base.model_copy(), EmployeeIn(**input)).model_dump(
+            exclude_none=True
+        )
+        for input in records
+    ]
+
+
+def build_employee(employee_out: EmployeeOut, employee_in: EmployeeIn) -> EmployeeOut:
     employee_out.attributes = build_attributes(employee_in)
     employee_out.metadata = build_metadata(employee_in)
-
-    return employee_out.model_dump(exclude_none=True)
+    return employee_out
 
 
 def build_attributes(employee_in: EmployeeIn) -> Attributes:
@@ -34,15 +82,15 @@ def build_attributes(employee_in: EmployeeIn) -> Attributes:
         first_name=employee_in.first_name,
         last_name=employee_in.last_name,
         ids=build_ids(employee_in),
-        config_flag=[Value[bool](value=False)],
+        config_flag=[BoolValue(value=False)],
         company=build_company(employee_in),
     )
 
 
 def build_ids(employee_in: EmployeeIn) -> list[Value[Id]]:
     return [
-        Value[Id](value=Id(type=[Value[str](value="hr_id")])),
-        Value[Id](value=Id(id=employee_in.employee_number)),
+        IdValue(value=Id(type=[StrValue(value="hr_id")])),
+        IdValue(value=Id(id=employee_in.employee_number)),
     ]
 
 
@@ -50,14 +98,14 @@ def build_company(employee_in: EmployeeIn) -> Optional[list[Value[Company]]]:
     if employee_in.company_code is None:
         return None
 
-    company = Company(company_code=[Value[str](value=employee_in.company_code)])
+    company = Company(company_code=[StrValue(value=employee_in.company_code)])
 
     if employee_in.employment_status is None:
-        return [Value[Company](value=company)]
+        return [CompanyValue(value=company)]
 
-    company.status = [Value[str](value=employee_in.employment_status)]
+    company.status = [StrValue(value=employee_in.employment_status)]
 
-    return [Value[Company](value=company)]
+    return [CompanyValue(value=company)]
 
 
 def build_metadata(employee_in: EmployeeIn) -> list[Metadata]:
@@ -0,0 +1,192 @@
+from typing import Any, Iterable, Optional
+
+from pydantic import TypeAdapter
+
+from .base import BatchMappable, Mappable
+from .encoding import employee_json
+from .schema import EmployeeIn
+
+# Built once at import: pydantic resolves the schema and builds the core
+# validator here rather than on first use.
+_validate = TypeAdapter(EmployeeIn).validate_python
+
+
+def mapper(input: dict[str, Any]) -> dict[str, Any]:
+    """The models in `schema.py` give us validation and type checking, but
+    the other pydantic mappers pay for it twice: once validating the input,
+    then again validating every little `Value[str](value=...)` in the
+    output, even though we built those from already-validated data, and a
+    third time walking the model tree in `model_dump`. This mapper
+    validates the input once and assembles the output directly in the
+    shape of `EmployeeOut`.
+
+    Why not `model_construct`? It skips validation, but it's implemented
+    in Python, and building the output tree with it turns out to be slower
+    than letting pydantic-core validate it.
+
+    Args:
+        input (dict[str, Any]): employee info
+
+    Returns:
+        dict[str, Any]: employee info in output format
+    """
+    employee_in = _validate(input)
+    return build_employee(
+        employee_in.event_timestamp,
+        employee_in.employee_number,
+        employee_in.first_name,
+        employee_in.last_name,
+        employee_in.company_code,
+        employee_in.employment_status,
+    )
+
+
+def trusted_mapper(input: dict[str, Any]) -> dict[str, Any]:
+    """Same as `mapper`, but for upstream data that has already been
+    validated: the input is only read, never validated.
+
+    Args:
+        input (dict[str, Any]): employee info
+
+    Returns:
+        dict[str, Any]: employee info in output format
+    """
+    return build_employee(
+        input["EventTimestamp"],
+        input["EmployeeNumber"],
+        input["FirstName"],
+        input["LastName"],
+        input.get("CompanyCode"),
+        input.get("EmploymentStatus"),
+    )
+
+
+def map_to_json(input: dict[str, Any]) -> bytes:
+    """JSON version of `mapper`: validates the input, then writes the
+    output document straight to JSON without building the dict.
+
+    Args:
+        input (dict[str, Any]): employee info
+
+    Returns:
+        bytes: employee info in output format, as UTF-8 JSON
+    """
+    employee_in = _validate(input)
+    return employee_json(
+        employee_in.event_timestamp,
+        employee_in.employee_number,
+        employee_in.first_name,
+        employee_in.last_name,
+        employee_in.company_code,
+        employee_in.employment_status,
+    )
+
+
+def trusted_map_to_json(input: dict[str, Any]) -> bytes:
+    """JSON version of `trusted_mapper`.
+
+    Args:
+        input (dict[str, Any]): employee info
+
+    Returns:
+        bytes: employee info in output format, as UTF-8 JSON
+    """
+    return employee_json(
+        input["EventTimestamp"],
+        input["EmployeeNumber"],
+        input["FirstName"],
+        input["LastName"],
+        input.get("CompanyCode"),
+        input.get("EmploymentStatus"),
+    )
+
+
+def map_many(
+    records: Iterable[dict[str, Any]], trusted: bool = False
+) -> list[dict[str, Any]]:
+    """Batch version of `mapper` (or `trusted_mapper` if `trusted`).
+
+    Args:
+        records (Iterable[dict[str, Any]]): employee info
+        trusted (bool): skip input validation
+
+    Returns:
+        list[dict[str, Any]]: employee info in output format
+    """
+    map_one = trusted_mapper if trusted else mapper
+    return [map_one(input) for input in records]
+
+
+def trusted_map_many(records: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Batch version of `trusted_mapper`.
+
+    Args:
+        records (Iterable[dict[str, Any]]): employee info
+
+    Returns:
+        list[dict[str, Any]]: employee info in output format
+    """
+    return [trusted_mapper(input) for input in records]
+
+
+def make_mapper(trusted: bool = False) -> Mappable:
+    """Pick the validating or trusted mapper, e.g. from configuration.
+
+    Args:
+        trusted (bool): skip input validation
+
+    Returns:
+        Mappable: the mapper
+    """
+    return trusted_mapper if trusted else mapper
+
+
+def make_batch_mapper(trusted: bool = False) -> BatchMappable:
+    """Pick the validating or trusted batch mapper.
+
+    Args:
+        trusted (bool): skip input validation
+
+    Returns:
+        BatchMappable: the batch mapper
+    """
+    return trusted_map_many if trusted else map_many
+
+
+def build_employee(
+    event_timestamp: str,
+    employee_number: str,
+    first_name: str,
+    last_name: str,
+    company_code: Optional[str] = None,
+    employment_status: Optional[str] = None,
+) -> dict[str, Any]:
+    attributes: dict[str, Any] = {
+        "first_name": first_name,
+        "last_name": last_name,
+        "ids": [
+            {"value": {"type": [{"value": "hr_id"}]}},
+            {"value": {"id": employee_number}},
+        ],
+        "config_flag": [{"value": False}],
+    }
+    if company_code is not None:
+        company: dict[str, Any] = {
+            "type": [{"value": ""}],
+            "company_code": [{"value": company_code}],
+        }
+        if employment_status is not None:
+            company["status"] = [{"value": employment_status}]
+        attributes["company"] = [{"value": company}]
+
+    return {
+        "type": "namespace/employee",
+        "attributes": attributes,
+        "metadata": [
+            {
+                "type": "namespace/source/name",
+                "value": employee_number,
+                "update_date": event_timestamp,
+            }
+        ],
+    }
@@ -1,8 +1,19 @@
-from typing import Any
+from typing import Any, Iterable
 
 from .base import base_employee
-from .functools import pipeline
-from .schema import Attributes, Company, EmployeeIn, EmployeeOut, Id, Metadata, Value
+from .functools import Pipeline
+from .schema import (
+    Attributes,
+    BoolValue,
+    Company,
+    CompanyValue,
+    EmployeeIn,
+    EmployeeOut,
+    Id,
+    IdValue,
+    Metadata,
+    StrValue,
+)
 
 
 def mapper(input: dict[str, Any]) -> dict[str, Any]:
@@ -35,29 +46,55 @@ def mapper(input: dict[str, Any]) -> dict[str, Any]:
     """
     employee_in = EmployeeIn(**input)
 
-    employee_out = pipeline(
-        EmployeeOut(**base_employee),
-        [
-            map_attributes,
-            map_company_code,
-            map_employment_status,
-            map_metadata,
-        ],
-        curried_args=[employee_in],
-    )
+    employee_out = employee_pipeline(EmployeeOut(**base_employee), employee_in)
 
     return employee_out.model_dump(exclude_none=True)
 
 
+def map_to_json(input: dict[str, Any]) -> bytes:
+    """JSON version of `mapper`: pydantic serializes the model tree
+    straight to JSON without going through a dict.
+
+    Args:
+        input (dict[str, Any]): employee info
+
+    Returns:
+        bytes: employee info in output format, as UTF-8 JSON
+    """
+    employee_out = employee_pipeline(EmployeeOut(**base_employee), EmployeeIn(**input))
+    return employee_out.model_dump_json(exclude_none=True).encode()
+
+
+def map_many(records: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Batch version of `mapper`. `base_employee` is validated into an
+    `EmployeeOut` once per batch and each record starts from a shallow copy
+    of it; `map_attributes` and `map_metadata` replace the nested models
+    outright, so the copies never share mutable state.
+
+    Args:
+        records (Iterable[dict[str, Any]]): employee info
+
+    Returns:
+        list[dict[str, Any]]: employee info in output format
+    """
+    base = EmployeeOut(**base_employee)
+    return [
+        employee_pipeline(base.model_copy(), EmployeeIn(**input)).model_dump(
+            exclude_none=True
+        )
+        for input in records
+    ]
+
+
 def map_attributes(employee_out: EmployeeOut, employee_in: EmployeeIn) -> EmployeeOut:
     employee_out.attributes = Attributes(
         first_name=employee_in.first_name,
         last_name=employee_in.last_name,
         ids=[
-            Value[Id](value=Id(type=[Value[str](value="hr_id")])),
-            Value[Id](value=Id(id=employee_in.employee_number)),
+            IdValue(value=Id(type=[StrValue(value="hr_id")])),
+            IdValue(value=Id(id=employee_in.employee_number)),
         ],
-        config_flag=[Value[bool](value=False)],
+        config_flag=[BoolValue(value=False)],
     )
     return employee_out
 
@@ -67,8 +104,8 @@ def map_company_code(employee_out: EmployeeOut, employee_in: EmployeeIn) -> Empl
         return employee_out
 
     employee_out.attributes.company = [
-        Value[Company](
-            value=Company(company_code=[Value[str](value=employee_in.company_code)])
+        CompanyValue(
+            value=Company(company_code=[StrValue(value=employee_in.company_code)])
         )
     ]
     return employee_out
@@ -83,7 +120,7 @@ def map_employment_status(
         return employee_out
 
     employee_out.attributes.company[0].value.status = [
-        Value[str](value=employee_in.employment_status)
+        StrValue(value=employee_in.employment_status)
     ]
     return employee_out
 
@@ -96,3 +133,13 @@ def map_metadata(employee_out: EmployeeOut, employee_in: EmployeeIn) -> Employee
         )
     ]
     return employee_out
+
+
+employee_pipeline: Pipeline[EmployeeOut] = Pipeline(
+    [
+        map_attributes,
+        map_company_code,
+        map_employment_status,
+        map_metadata,
+    ]
+)
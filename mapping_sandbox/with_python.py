@@ -1,10 +1,21 @@
-import copy
-from typing import Any
+from typing import Any, Iterable, Literal, Union, overload
 
-from .base import base_employee
+from . import encoding
+from .base import new_employee
+from .compact import CompactEmployee
 
 
-def mapper(input: dict[str, Any]) -> dict[str, Any]:
+@overload
+def mapper(input: dict[str, Any], compact: Literal[False] = ...) -> dict[str, Any]: ...
+
+
+@overload
+def mapper(input: dict[str, Any], compact: Literal[True]) -> CompactEmployee: ...
+
+
+def mapper(
+    input: dict[str, Any], compact: bool = False
+) -> Union[dict[str, Any], CompactEmployee]:
     """Straight forward, vanilla Python implementation. This approach
     has two problems:
 
@@ -16,14 +27,66 @@ def mapper(input: dict[str, Any]) -> dict[str, Any]:
     the function also goes up due to the proliferation of if/else
     statements.
 
+    With `compact`, the output is a `CompactEmployee` instead, which
+    compares equal to the dict but only builds it if it's read.
+
+    Args:
+        input (dict[str, Any]): employee info
+        compact (bool): return a `CompactEmployee`
+
+    Returns:
+        Union[dict[str, Any], CompactEmployee]: employee info in output format
+    """
+    if compact:
+        return CompactEmployee.from_input(input)
+    return populate(new_employee(), input)
+
+
+def map_to_json(input: dict[str, Any]) -> bytes:
+    """JSON version of `mapper`: writes the output document straight to
+    JSON, without building the dict first.
+
     Args:
         input (dict[str, Any]): employee info
 
     Returns:
-        dict[str, Any]: employee info in output format
+        bytes: employee info in output format, as UTF-8 JSON
     """
-    output = copy.deepcopy(base_employee)
+    return encoding.map_to_json(input)
+
+
+@overload
+def map_many(
+    records: Iterable[dict[str, Any]], compact: Literal[False] = ...
+) -> list[dict[str, Any]]: ...
+
+
+@overload
+def map_many(
+    records: Iterable[dict[str, Any]], compact: Literal[True]
+) -> list[CompactEmployee]: ...
+
+
+def map_many(
+    records: Iterable[dict[str, Any]], compact: bool = False
+) -> Union[list[dict[str, Any]], list[CompactEmployee]]:
+    """Batch version of `mapper`.
+
+    Args:
+        records (Iterable[dict[str, Any]]): employee info
+        compact (bool): return `CompactEmployee`s
+
+    Returns:
+        Union[list[dict[str, Any]], list[CompactEmployee]]: employee info in
+            output format
+    """
+    if compact:
+        from_input = CompactEmployee.from_input
+        return [from_input(input) for input in records]
+    return [populate(new_employee(), input) for input in records]
+
 
+def populate(output: dict[str, Any], input: dict[str, Any]) -> dict[str, Any]:
     # Required fields.
     output["metadata"][0]["update_date"] = input["EventTimestamp"]
     output["metadata"][0]["value"] = input["EmployeeNumber"]
@@ -1,8 +1,9 @@
-import copy
 from functools import reduce
-from typing import Any
+from typing import Any, Iterable
 
-from .base import base_employee
+from . import encoding
+from .base import new_employee
+from .router import FieldRouter
 
 
 def mapper(input: dict[str, Any]) -> dict[str, Any]:
@@ -13,38 +14,96 @@ def mapper(input: dict[str, Any]) -> dict[str, Any]:
     said, the unit tests would still need to know a great deal about the
     convoluted output data structure.
 
+    Only the fields `router` has handlers for are reduced over, in an
+    order that puts CompanyCode before the EmploymentStatus that depends
+    on it; any other keys in the input are never looked at.
+
     Args:
         input (dict[str, Any]): employee info
 
     Returns:
         dict[str, Any]: employee info in output format
     """
-    output = copy.deepcopy(base_employee)
-    return reduce(build_employee, input.items(), output)
+    return reduce(build_employee, router.items(input), new_employee())
+
+
+def map_to_json(input: dict[str, Any]) -> bytes:
+    """JSON version of `mapper`: writes the output document straight to
+    JSON, without building the dict first.
+
+    Args:
+        input (dict[str, Any]): employee info
+
+    Returns:
+        bytes: employee info in output format, as UTF-8 JSON
+    """
+    return encoding.map_to_json(input)
+
+
+def map_many(records: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Batch version of `mapper`.
+
+    Args:
+        records (Iterable[dict[str, Any]]): employee info
+
+    Returns:
+        list[dict[str, Any]]: employee info in output format
+    """
+    return [
+        reduce(build_employee, router.items(input), new_employee()) for input in records
+    ]
 
 
 def build_employee(output: dict[str, Any], item: tuple[str, Any]) -> dict[str, Any]:
     key, value = item
-    if key == "EventTimestamp":
-        output["metadata"][0]["update_date"] = value
-    elif key == "EmployeeNumber":
-        output["attributes"]["ids"].append({"value": {"id": value}})
-        output["metadata"][0]["value"] = value
-    elif key == "FirstName":
-        output["attributes"]["first_name"] = value
-    elif key == "LastName":
-        output["attributes"]["last_name"] = value
-    elif key == "CompanyCode":
-        output["attributes"]["company"] = [
-            {
-                "value": {
-                    "type": [{"value": ""}],
-                    "company_code": [{"value": value}],
-                }
-            }
-        ]
-    elif key == "EmploymentStatus":
-        output["attributes"]["company"][0]["value"]["status"] = [{"value": value}]
-    else:
-        pass
+    handler = router.handlers.get(key)
+    if handler is not None:
+        handler(output, value)
     return output
+
+
+def map_event_timestamp(output: dict[str, Any], value: Any) -> None:
+    output["metadata"][0]["update_date"] = value
+
+
+def map_employee_number(output: dict[str, Any], value: Any) -> None:
+    output["attributes"]["ids"].append({"value": {"id": value}})
+    output["metadata"][0]["value"] = value
+
+
+def map_first_name(output: dict[str, Any], value: Any) -> None:
+    output["attributes"]["first_name"] = value
+
+
+def map_last_name(output: dict[str, Any], value: Any) -> None:
+    output["attributes"]["last_name"] = value
+
+
+def map_company_code(output: dict[str, Any], value: Any) -> None:
+    output["attributes"]["company"] = [
+        {
+            "value": {
+                "type": [{"value": ""}],
+                "company_code": [{"value": value}],
+            }
+        }
+    ]
+
+
+def map_employment_status(output: dict[str, Any], value: Any) -> None:
+    output["attributes"]["company"][0]["value"]["status"] = [{"value": value}]
+
+
+# EmploymentStatus lives inside the company entry, so it's handled after
+# CompanyCode whatever order the input has them in, and dropped without it.
+router = FieldRouter(
+    {
+        "EventTimestamp": map_event_timestamp,
+        "EmployeeNumber": map_employee_number,
+        "FirstName": map_first_name,
+        "LastName": map_last_name,
+        "CompanyCode": map_company_code,
+        "EmploymentStatus": map_employment_status,
+    },
+    requires={"EmploymentStatus": "CompanyCode"},
+)
@@ -0,0 +1,66 @@
+from typing import Any, Callable
+
+from .base import BatchMappable, Mappable
+from .compiler import (
+    Field,
+    When,
+    compile_batch_spec,
+    compile_json_spec,
+    compile_spec,
+)
+
+# =====================================================================
+# The mapping is described declaratively, shaped exactly like the
+# output, and compiled into a specialized Python function when this
+# module is imported. The benefits here:
+#
+# 1. Adding a source system means writing a spec, not a mapper.
+# 2. The generated code builds the output as a single nested literal:
+#    no deepcopy of `base_employee`, no mutation, no per-field function
+#    calls, and no interpretation of the spec per record.
+#
+# The downside: the mapping logic lives in generated code, so when it's
+# wrong you debug the compiler. `compiler.generate_source()` shows what
+# it produces.
+# =====================================================================
+
+employee_spec: dict[str, Any] = {
+    "type": "namespace/employee",
+    "attributes": {
+        "first_name": Field("FirstName"),
+        "last_name": Field("LastName"),
+        "ids": [
+            {"value": {"type": [{"value": "hr_id"}]}},
+            {"value": {"id": Field("EmployeeNumber")}},
+        ],
+        "config_flag": [{"value": False}],
+        "company": When(
+            "CompanyCode",
+            [
+                {
+                    "value": {
+                        "type": [{"value": ""}],
+                        "company_code": [{"value": Field("CompanyCode")}],
+                        "status": When(
+                            "EmploymentStatus",
+                            [{"value": Field("EmploymentStatus")}],
+                        ),
+                    }
+                }
+            ],
+        ),
+    },
+    "metadata": [
+        {
+            "type": "namespace/source/name",
+            "value": Field("EmployeeNumber"),
+            "update_date": Field("EventTimestamp"),
+        }
+    ],
+}
+
+mapper: Mappable = compile_spec(employee_spec, "mapper", __name__)
+map_many: BatchMappable = compile_batch_spec(employee_spec, "mapper", __name__)
+map_to_json: Callable[[dict[str, Any]], bytes] = compile_json_spec(
+    employee_spec, "map_to_json", __name__
+)
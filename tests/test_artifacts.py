@@ -0,0 +1,100 @@
+import marshal
+import os
+from pathlib import Path
+
+import pytest
+
+from mapping_sandbox import artifacts, registry
+from mapping_sandbox.compiler import compile_spec
+from mapping_sandbox.warmup import warmup
+from mapping_sandbox.with_spec import employee_spec
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("MAPPING_SANDBOX_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_code_is_cached_on_disk(cache_dir: Path):
+    first = artifacts.compile_cached("x = 1 + 1\n", "<test>")
+    (entry,) = cache_dir.glob("code/*/*.marshal")
+    second = artifacts.compile_cached("x = 1 + 1\n", "<test>")
+    assert first == second
+    assert second.co_filename == "<test>"
+
+    artifacts.compile_cached("x = 2\n", "<test>")
+    assert len(list(cache_dir.glob("code/*/*.marshal"))) == 2
+    assert entry.exists()
+
+
+def test_corrupt_entries_are_recompiled(cache_dir: Path):
+    artifacts.compile_cached("x = 1\n", "<test>")
+    (entry,) = cache_dir.glob("code/*/*.marshal")
+    entry.write_bytes(b"garbage")
+    namespace: dict = {}
+    exec(artifacts.compile_cached("x = 1\n", "<test>"), namespace)
+    assert namespace["x"] == 1
+
+
+def cached_values(cache_dir: Path) -> dict[int, Path]:
+    entries: dict[int, Path] = {}
+    for entry in cache_dir.glob("code/*/*.marshal"):
+        namespace: dict = {}
+        exec(marshal.loads(entry.read_bytes()), namespace)
+        entries[namespace["x"]] = entry
+    return entries
+
+
+def test_least_recently_used_entries_are_pruned(
+    cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(artifacts, "MAX_CODE_ENTRIES", 2)
+    artifacts.compile_cached("x = 1\n", "<test>")
+    artifacts.compile_cached("x = 2\n", "<test>")
+    for x, entry in cached_values(cache_dir).items():
+        os.utime(entry, (x, x))  # far in the past, in order
+
+    artifacts.compile_cached("x = 1\n", "<test>")  # a hit, which touches it
+    artifacts.compile_cached("x = 3\n", "<test>")
+    assert set(cached_values(cache_dir)) == {1, 3}
+
+
+def test_compiled_specs_use_the_cache(cache_dir: Path):
+    mapper = compile_spec(employee_spec, "cached_mapper")
+    assert list(cache_dir.glob("code/*/*.marshal"))
+    again = compile_spec(employee_spec, "cached_mapper")
+    record = {
+        "EventTimestamp": "2023-11-02T02:15:42.847038",
+        "EmployeeNumber": "012345",
+        "FirstName": "John",
+        "LastName": "McClane",
+    }
+    assert mapper(record) == again(record)
+
+
+def test_unwritable_caches_are_ignored(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    blocker = tmp_path / "file"
+    blocker.touch()
+    monkeypatch.setenv("MAPPING_SANDBOX_CACHE_DIR", str(blocker))
+    namespace: dict = {}
+    exec(artifacts.compile_cached("x = 3\n", "<test>"), namespace)
+    assert namespace["x"] == 3
+
+
+def test_package_version():
+    assert artifacts.package_version("pydantic") != "none"
+    assert artifacts.package_version("no-such-package") == "none"
+
+
+def test_warmup_reports_every_step():
+    timings = warmup(["python", "jinja"])
+    assert list(timings) == [
+        "import mapping_sandbox.with_python",
+        "import mapping_sandbox.with_jinja",
+        "template",
+        "first call python",
+        "first call jinja",
+    ]
+    assert all(seconds >= 0 for seconds in timings.values())
+    assert set(warmup()) >= {f"first call {name}" for name in registry.names()}
@@ -0,0 +1,32 @@
+import copy
+
+import pytest
+
+from mapping_sandbox.base import base_employee, freeze, new_employee
+
+
+def test_new_employee_matches_base_employee():
+    assert freeze(new_employee()) == base_employee
+
+
+def test_new_employee_builds_independent_trees():
+    first, second = new_employee(), new_employee()
+    first["attributes"]["ids"].append({"value": {"id": "012345"}})
+    assert len(second["attributes"]["ids"]) == 1
+    assert first["attributes"]["config_flag"] is not second["attributes"]["config_flag"]
+
+
+def test_base_employee_is_frozen():
+    with pytest.raises(TypeError):
+        base_employee["type"] = "foo/bar"  # type: ignore[index]
+    with pytest.raises(TypeError):
+        base_employee["attributes"]["config_flag"][0]["value"] = True
+    with pytest.raises(AttributeError):
+        base_employee["attributes"]["ids"].append({})
+
+
+def test_base_employee_deep_copies_to_a_mutable_tree():
+    employee = copy.deepcopy(base_employee)
+    assert employee == new_employee()
+    employee["attributes"]["ids"].append({"value": {"id": "012345"}})
+    assert len(base_employee["attributes"]["ids"]) == 1
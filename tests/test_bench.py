@@ -0,0 +1,69 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from mapping_sandbox import registry
+from mapping_sandbox.bench.__main__ import main
+from mapping_sandbox.bench.runner import compare, measure, run
+from mapping_sandbox.bench.workloads import WORKLOADS, generate
+
+
+@pytest.mark.parametrize("workload", WORKLOADS)
+def test_workloads_are_reproducible_and_valid(workload: str):
+    records = generate(workload, 50, seed=1)
+    assert records == generate(workload, 50, seed=1)
+    for record in records:
+        assert "EmploymentStatus" not in record or "CompanyCode" in record
+        registry.get_mapper("python")(record)
+
+
+def test_workload_shapes():
+    assert not any("CompanyCode" in r for r in generate("required", 20))
+    assert all("EmploymentStatus" in r for r in generate("status", 20))
+
+
+def test_run_reports_every_metric():
+    data = run(["python", "spec"], ["mixed"], count=20)
+    assert set(data["results"]) == {"python", "spec"}
+    metrics = data["results"]["python"]["mixed"]
+    assert metrics["ops_per_sec"] > 0
+    assert metrics["p50_us"] <= metrics["p99_us"]
+    assert metrics["retained_blocks_per_record"] > 0
+    assert metrics["peak_rss_kb"] > 0
+
+
+def test_compare_flags_regressions_only():
+    before = run(["python"], ["required"], count=20)
+    after = json.loads(json.dumps(before))
+    assert compare(before, after) == []
+    after["results"]["python"]["required"]["ops_per_sec"] /= 2
+    after["results"]["python"]["required"]["p99_us"] /= 2
+    (regression,) = compare(before, after)
+    assert regression.metric == "ops_per_sec"
+
+
+def test_empty_runs_measure_zero():
+    result = measure(registry.get_mapper("python"), [])
+    assert result.ops_per_sec == result.p99_us == 0
+    assert result.retained_blocks_per_record == 0
+
+
+def test_compare_handles_zeros():
+    before = run(["python"], ["required"], count=20)
+    after = json.loads(json.dumps(before))
+    after["results"]["python"]["required"]["ops_per_sec"] = 0
+    after["results"]["python"]["required"]["bytes_per_record"] = 0
+    (regression,) = compare(before, after)
+    assert regression.metric == "ops_per_sec"
+    assert regression.ratio == 0
+    assert compare(after, after) == []
+    assert [c.metric for c in compare(after, before)] == ["bytes_per_record"]
+
+
+def test_cli_round_trip(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    output = tmp_path / "results.json"
+    args = ["run", "-m", "python", "-w", "required", "-n", "20", "-o", str(output)]
+    assert main(args) == 0
+    assert "python" in capsys.readouterr().out
+    assert main(["compare", str(output), str(output)]) == 0
@@ -0,0 +1,100 @@
+from typing import Any
+
+import pytest
+
+from mapping_sandbox import with_python
+from mapping_sandbox.coalesce import Coalescer
+
+
+def event(number: str, timestamp: str, **fields: Any) -> dict[str, Any]:
+    return {
+        "EventTimestamp": timestamp,
+        "EmployeeNumber": number,
+        "FirstName": "Hans",
+        "LastName": "Gruber",
+        **fields,
+    }
+
+
+def test_last_write_wins_per_employee():
+    events = [
+        event("1", "2023-11-02T00:00:00", CompanyCode="A"),
+        event("2", "2023-11-02T00:00:00"),
+        event("1", "2023-11-02T00:00:02", CompanyCode="C"),
+        event("1", "2023-11-02T00:00:01", CompanyCode="B"),  # arrives late
+    ]
+    survivors = list(Coalescer(with_python.mapper).coalesce(events))
+    assert [s.output for s in survivors] == [
+        with_python.mapper(events[1]),
+        with_python.mapper(events[2]),
+    ]
+    assert [(s.employee_number, s.sequence, s.superseded) for s in survivors] == [
+        ("2", 1, 0),
+        ("1", 2, 2),
+    ]
+
+
+def test_count_based_windows():
+    events = [event(str(n % 2), f"2023-11-02T00:00:0{n}") for n in range(5)]
+    survivors = list(Coalescer(with_python.mapper, max_records=2).coalesce(events))
+    assert [(s.window, s.sequence) for s in survivors] == [
+        (0, 0),
+        (0, 1),
+        (1, 2),
+        (1, 3),
+        (2, 4),
+    ]
+
+
+def test_time_based_windows():
+    now = [0.0]
+    coalescer = Coalescer(
+        with_python.mapper, max_records=None, max_seconds=5, clock=lambda: now[0]
+    )
+    assert coalescer.add(event("1", "2023-11-02T00:00:00")) == []
+    now[0] = 4.9
+    assert coalescer.add(event("1", "2023-11-02T00:00:01")) == []
+    now[0] = 5.0
+    (survivor,) = coalescer.add(event("1", "2023-11-02T00:00:02"))
+    assert (survivor.event_timestamp, survivor.superseded) == ("2023-11-02T00:00:01", 1)
+    (survivor,) = coalescer.flush()
+    assert (survivor.window, survivor.event_timestamp) == (1, "2023-11-02T00:00:02")
+
+
+def test_idle_windows_close_on_poll():
+    now = [0.0]
+    coalescer = Coalescer(
+        with_python.mapper, max_records=None, max_seconds=5, clock=lambda: now[0]
+    )
+    assert coalescer.poll() == []
+    coalescer.add(event("1", "2023-11-02T00:00:00"))
+    now[0] = 4.9
+    assert coalescer.poll() == []
+    now[0] = 5.0
+    (survivor,) = coalescer.poll()
+    assert (survivor.window, survivor.employee_number) == (0, "1")
+    assert coalescer.poll() == coalescer.flush() == []
+
+
+def test_a_failed_flush_keeps_the_window():
+    calls = [0]
+
+    def flaky(record: dict[str, Any]) -> dict[str, Any]:
+        calls[0] += 1
+        if calls[0] == 2:
+            raise RuntimeError("mapper down")
+        return with_python.mapper(record)
+
+    coalescer = Coalescer(flaky)
+    events = [event("1", "2023-11-02T00:00:00"), event("2", "2023-11-02T00:00:00")]
+    for record in events:
+        coalescer.add(record)
+    with pytest.raises(RuntimeError):
+        coalescer.flush()
+    survivors = coalescer.flush()
+    assert [(s.window, s.employee_number) for s in survivors] == [(0, "1"), (0, "2")]
+
+
+def test_a_window_needs_a_bound():
+    with pytest.raises(ValueError):
+        Coalescer(with_python.mapper, max_records=None)
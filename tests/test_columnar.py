@@ -0,0 +1,60 @@
+from typing import Any
+
+import pytest
+
+from mapping_sandbox import with_python
+from mapping_sandbox.bench.workloads import generate
+from mapping_sandbox.columnar import map_columns
+
+FIELDS = [
+    "EventTimestamp",
+    "EmployeeNumber",
+    "FirstName",
+    "LastName",
+    "CompanyCode",
+    "EmploymentStatus",
+]
+
+
+def to_columns(records: list[dict[str, Any]]) -> dict[str, list[Any]]:
+    return {field: [record.get(field) for record in records] for field in FIELDS}
+
+
+@pytest.mark.parametrize("share_constants", [True, False])
+def test_matches_row_mapper(share_constants: bool):
+    records = generate("mixed", 100)
+    outputs = map_columns(to_columns(records), share_constants=share_constants)
+    assert outputs == [with_python.mapper(record) for record in records]
+
+
+def test_optional_columns_may_be_missing():
+    records = generate("required", 10)
+    columns = to_columns(records)
+    del columns["CompanyCode"], columns["EmploymentStatus"]
+    assert map_columns(columns) == [with_python.mapper(r) for r in records]
+
+
+def test_constants_are_shared_only_when_asked():
+    columns = to_columns(generate("company", 2))
+    first, second = map_columns(columns, share_constants=True)
+    assert first["attributes"]["config_flag"] is second["attributes"]["config_flag"]
+    first, second = map_columns(columns)
+    assert first["attributes"]["config_flag"] is not second["attributes"]["config_flag"]
+    assert first["attributes"]["ids"] is not second["attributes"]["ids"]
+
+
+def test_bad_columns_are_rejected():
+    columns = to_columns(generate("required", 3))
+    with pytest.raises(ValueError):
+        map_columns({**columns, "FirstName": ["John"]})
+    with pytest.raises(ValueError):
+        map_columns({**columns, "CompanyCode": ["VOLKSFREI"]})
+    del columns["LastName"]
+    with pytest.raises(KeyError):
+        map_columns(columns)
+
+
+def test_unrelated_columns_are_ignored():
+    records = generate("required", 3)
+    columns = {**to_columns(records), "Department": ["Security"]}
+    assert map_columns(columns) == [with_python.mapper(r) for r in records]
@@ -0,0 +1,74 @@
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+
+from mapping_sandbox import with_python
+from mapping_sandbox.bench.workloads import generate
+from mapping_sandbox.compact import MISSING, CompactEmployee, json_default
+from mapping_sandbox.sinks import FileSink, employee_id
+
+
+@pytest.fixture
+def records() -> list[dict]:
+    return generate("mixed", 60)
+
+
+def test_equal_to_the_dict_form(records: list[dict]):
+    compact = with_python.map_many(records, compact=True)
+    expected = with_python.map_many(records)
+    assert compact == expected
+    assert expected == compact
+    assert [dict(c) for c in compact] == expected
+    assert [c.to_dict() for c in compact] == expected
+    assert [with_python.mapper(r, compact=True) for r in records] == compact
+
+
+def test_json_matches(records: list[dict]):
+    for record in records:
+        output = CompactEmployee.from_input(record)
+        assert json.loads(output.to_json()) == with_python.mapper(record)
+
+
+def test_builds_nothing_until_read():
+    record = generate("status", 1)[0]
+    output = with_python.mapper(record, compact=True)
+    assert output.employee_number == record["EmployeeNumber"]
+    assert output.company_code == record["CompanyCode"]
+    assert employee_id(output) == record["EmployeeNumber"]
+    assert output._document is None
+    assert output["metadata"][0]["value"] == record["EmployeeNumber"]
+    assert output._document is not None
+
+
+def test_optional_fields_are_keyed_on_presence():
+    record = {**generate("required", 1)[0], "CompanyCode": None}
+    assert with_python.mapper(record, compact=True) == with_python.mapper(record)
+    orphan = CompactEmployee("t", "1", "a", "b", employment_status="X")
+    assert orphan.employment_status is MISSING
+    assert "company" not in orphan["attributes"]
+
+
+def test_pickles(records: list[dict]):
+    compact = with_python.map_many(records, compact=True)
+    restored = pickle.loads(pickle.dumps(compact))
+    assert restored == compact
+    assert restored == with_python.map_many(records)
+
+
+def test_sinks_write_compact_outputs(tmp_path: Path, records: list[dict]):
+    with FileSink(tmp_path, partitions=3) as sink:
+        sink.write_many(with_python.map_many(records, compact=True))
+    lines = [
+        json.loads(line) for p in sink.paths for line in p.read_text().splitlines()
+    ]
+    assert len(lines) == len(records)
+
+
+def test_json_default_encodes_compact_outputs(records: list[dict]):
+    compact = with_python.map_many(records, compact=True)
+    encoded = json.dumps({"employees": compact}, default=json_default)
+    assert json.loads(encoded) == {"employees": with_python.map_many(records)}
+    with pytest.raises(TypeError):
+        json.dumps(object(), default=json_default)
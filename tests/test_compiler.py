@@ -0,0 +1,49 @@
+import pytest
+
+from mapping_sandbox.compiler import (
+    Field,
+    When,
+    compile_batch_spec,
+    compile_spec,
+    generate_source,
+)
+
+
+def test_constants_and_fields_compile_to_one_literal():
+    spec = {"a": [{"value": Field("A")}], "b": True}
+    assert "if" not in generate_source(spec)
+    assert compile_spec(spec)({"A": 1}) == {"a": [{"value": 1}], "b": True}
+
+
+def test_when_entries_follow_their_key():
+    spec = {"a": Field("A"), "b": When("B", {"c": Field("B"), "d": When("D", 1)})}
+    mapper = compile_spec(spec)
+    assert mapper({"A": 1}) == {"a": 1}
+    assert mapper({"A": 1, "B": 2}) == {"a": 1, "b": {"c": 2}}
+    assert mapper({"A": 1, "B": 2, "D": 3}) == {"a": 1, "b": {"c": 2, "d": 1}}
+    # Nested optional entries are never emitted without their parent.
+    assert mapper({"A": 1, "D": 3}) == {"a": 1}
+
+
+def test_outputs_are_fresh_objects():
+    mapper = compile_spec({"a": [{"value": "x"}]})
+    assert mapper({})["a"] is not mapper({})["a"]
+
+
+def test_missing_required_field_raises():
+    with pytest.raises(KeyError):
+        compile_spec({"a": Field("A")})({})
+
+
+def test_batch_matches_single():
+    spec = {"a": Field("A"), "b": When("B", [Field("B")])}
+    records = [{"A": 1}, {"A": 2, "B": 3}]
+    assert compile_batch_spec(spec)(records) == [
+        compile_spec(spec)(record) for record in records
+    ]
+
+
+@pytest.mark.parametrize("spec", [When("A", 1), {"a": object()}])
+def test_invalid_specs_are_rejected(spec):
+    with pytest.raises(TypeError):
+        compile_spec(spec)
@@ -1,31 +1,25 @@
-from typing import Any
+import json
+from typing import Any, Callable
 
 import pytest
 
-from mapping_sandbox import (
-    with_jinja,
-    with_pipeline,
-    with_pydantic,
-    with_pydantic_builder,
-    with_pydantic_pipeline,
-    with_python,
-    with_reduce,
-)
-from mapping_sandbox.base import Mappable
+from mapping_sandbox import registry, with_python
+from mapping_sandbox.base import BatchMappable, Mappable
+from mapping_sandbox.conformance import REFERENCE_CASES
 
 # =====================================================================
-# Register all the mappers for testing
+# All the mappers registered in mapping_sandbox/registry.py are tested
 # =====================================================================
 
 
-mappers: list[Mappable] = [
-    with_jinja.mapper,
-    with_pipeline.mapper,
-    with_pydantic.mapper,
-    with_pydantic_builder.mapper,
-    with_pydantic_pipeline.mapper,
-    with_python.mapper,
-    with_reduce.mapper,
+mappers: list[Mappable] = [registry.get_mapper(name) for name in registry.names()]
+
+batch_mappers: list[BatchMappable] = [
+    registry.get_batch_mapper(name) for name in registry.names()
+]
+
+json_mappers: list[Callable[[dict[str, Any]], bytes]] = [
+    registry.get_json_mapper(name) for name in registry.names()
 ]
 
 # =====================================================================
@@ -147,3 +141,88 @@ def test_map_optional_fields_company_code(mapper: Mappable):
             }
         ],
     }
+
+
+def test_conformance_cases_match_these_tests():
+    # A "mapper" that answers from conformance's copy of the cases passes
+    # the tests above only if the copy matches their literals.
+    used: list[int] = []
+
+    def reference_mapper(input: dict[str, Any]) -> dict[str, Any]:
+        for index, (case, expected) in enumerate(REFERENCE_CASES):
+            if case == input:
+                used.append(index)
+                return expected
+        raise KeyError(input)
+
+    test_map_required_fields(reference_mapper)
+    test_map_optional_fields_all(reference_mapper)
+    test_map_optional_fields_company_code(reference_mapper)
+    assert sorted(used) == list(range(len(REFERENCE_CASES)))
+
+
+@pytest.mark.parametrize("map_many", batch_mappers, ids=id_from_fn)
+def test_map_many_matches_mapper(map_many: BatchMappable):
+    records = [
+        {
+            "EventTimestamp": "2023-11-02T02:15:42.847038",
+            "EmployeeNumber": "012345",
+            "FirstName": "John",
+            "LastName": "McClane",
+        },
+        {
+            "EventTimestamp": "2023-11-02T02:15:42.847038",
+            "EmployeeNumber": "054321",
+            "FirstName": "Hans",
+            "LastName": "Gruber",
+            "CompanyCode": "VOLKSFREI",
+        },
+        {
+            "EventTimestamp": "2023-11-02T02:15:42.847038",
+            "EmployeeNumber": "054321",
+            "FirstName": "Hans",
+            "LastName": "Gruber",
+            "CompanyCode": "VOLKSFREI",
+            "EmploymentStatus": "TERMINATED",
+        },
+    ]
+    outputs = map_many(records)
+    assert outputs == [with_python.mapper(record) for record in records]
+    # Each output must be its own tree, not a shared skeleton.
+    assert outputs[0]["attributes"]["ids"] is not outputs[1]["attributes"]["ids"]
+
+
+@pytest.mark.parametrize("map_to_json", json_mappers, ids=id_from_fn)
+@pytest.mark.parametrize(
+    "input",
+    [
+        {
+            "EventTimestamp": "2023-11-02T02:15:42.847038",
+            "EmployeeNumber": "012345",
+            "FirstName": "John",
+            "LastName": "McClane",
+        },
+        {
+            "EventTimestamp": "2023-11-02T02:15:42.847038",
+            "EmployeeNumber": "054321",
+            "FirstName": "Hans",
+            "LastName": "Gruber",
+            "CompanyCode": "VOLKSFREI",
+        },
+        {
+            "EventTimestamp": "2023-11-02T02:15:42.847038",
+            "EmployeeNumber": "054321",
+            "FirstName": 'Hans "Bill Clay"',
+            "LastName": "Grüber\\{{ }}",
+            "CompanyCode": "VOLKS\nFREI",
+            "EmploymentStatus": "TERMINATED\t",
+        },
+    ],
+    ids=["required", "company_code", "escaped"],
+)
+def test_map_to_json_matches_mapper(
+    map_to_json: Callable[[dict[str, Any]], bytes], input: dict[str, Any]
+):
+    output = map_to_json(input)
+    assert isinstance(output, bytes)
+    assert json.loads(output) == with_python.mapper(input)
@@ -0,0 +1,40 @@
+import pytest
+
+from mapping_sandbox import with_jinja, with_python
+from mapping_sandbox.bench.workloads import generate
+from mapping_sandbox.executor import Failure, map_parallel
+
+
+def test_outputs_keep_input_order():
+    records = generate("mixed", 250)
+    outputs = list(map_parallel(with_python.mapper, records, workers=2, chunk_size=7))
+    assert outputs == [with_python.mapper(record) for record in records]
+
+
+def test_warm_workers_with_cached_templates():
+    records = generate("status", 20)
+    outputs = list(map_parallel(with_jinja.mapper, records, workers=2, chunk_size=5))
+    assert outputs == [with_python.mapper(record) for record in records]
+
+
+def test_bad_records_fail_alone():
+    records = generate("required", 10)
+    # with_python reads every required field, so a missing one raises.
+    bad = {k: v for k, v in records[4].items() if k != "FirstName"}
+    records[4] = bad
+    outputs = list(map_parallel(with_python.mapper, records, workers=2, chunk_size=3))
+    assert len(outputs) == 10
+    failure = outputs[4]
+    assert isinstance(failure, Failure)
+    assert failure.index == 4
+    assert failure.record == bad
+    assert failure.error.startswith("KeyError")
+    assert not any(isinstance(o, Failure) for i, o in enumerate(outputs) if i != 4)
+
+
+@pytest.mark.parametrize(
+    "options", [{"chunk_size": 0}, {"chunk_size": -1}, {"workers": 0}]
+)
+def test_bad_sizes_are_rejected_up_front(options: dict):
+    with pytest.raises(ValueError):
+        map_parallel(with_python.mapper, generate("required", 3), **options)
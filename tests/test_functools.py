@@ -0,0 +1,65 @@
+from typing import Any
+
+import pytest
+
+from mapping_sandbox.functools import Pipeline, pipeline
+
+
+def add(out: int, n: int) -> int:
+    return out + n
+
+
+def double(out: int, _: int) -> int:
+    return out * 2
+
+
+def fail(out: int, _: int) -> int:
+    raise ValueError(out)
+
+
+def test_compiled_pipeline_matches_pipeline():
+    funcs = [add, double, add]
+    assert Pipeline(funcs)(1, 3) == pipeline(1, funcs, curried_args=[3]) == 11
+
+
+def test_arity_is_configurable():
+    def concat(out: str, a: str, b: str) -> str:
+        return out + a + b
+
+    assert Pipeline([concat, concat], arity=2)("", "x", "y") == "xyxy"
+    assert Pipeline([str.upper], arity=0)("abc") == "ABC"
+
+
+def test_profiling_is_off_by_default():
+    run = Pipeline([add, double])
+    run(1, 1)
+    assert run.stats == {}
+
+
+def test_profiling_counts_calls_time_and_errors():
+    run: Pipeline[Any] = Pipeline([add, double, fail], profile=True)
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            run(1, 1)
+    assert run.stats["0:add"].calls == 2
+    assert run.stats["1:double"].seconds > 0
+    assert run.stats["2:fail"].errors == 2
+
+    run.reset()
+    assert run.stats["0:add"].calls == 0
+    run.profile = False
+    with pytest.raises(ValueError):
+        run(1, 1)
+    assert run.stats["2:fail"].errors == 0
+
+
+def test_steps_with_the_same_name_are_profiled_apart():
+    run: Pipeline[Any] = Pipeline(
+        [add, lambda out, _: out, add, lambda out, _: fail(out, _)], profile=True
+    )
+    with pytest.raises(ValueError):
+        run(1, 1)
+    assert list(run.stats) == ["0:add", "1:<lambda>", "2:add", "3:<lambda>"]
+    assert run.stats["2:add"].calls == 1
+    assert run.stats["1:<lambda>"].errors == 0
+    assert run.stats["3:<lambda>"].errors == 1
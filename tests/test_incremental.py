@@ -0,0 +1,51 @@
+import copy
+import random
+
+from mapping_sandbox import with_python
+from mapping_sandbox.bench.workloads import generate
+from mapping_sandbox.incremental import changed_fields, remap
+
+
+def test_changed_fields_include_added_and_removed_fields():
+    previous = {"FirstName": "Hans", "CompanyCode": "VOLKSFREI"}
+    input = {"FirstName": "Hans", "EmploymentStatus": "TERMINATED"}
+    assert changed_fields(previous, input) == {"CompanyCode", "EmploymentStatus"}
+
+
+def test_remap_matches_full_mapping():
+    rng = random.Random(0)
+    records = generate("mixed", 200)
+    for previous, input in zip(records, records[1:]):
+        # Mix whole-record changes with the common single-field ones.
+        if rng.random() < 0.5:
+            field = rng.choice(["EmploymentStatus", "LastName", "CompanyCode"])
+            input = {**previous, field: input.get(field, "X")}
+            if field == "CompanyCode" and rng.random() < 0.5:
+                input.pop("CompanyCode")
+                if rng.random() < 0.5:
+                    input.pop("EmploymentStatus", None)
+        previous_output = with_python.mapper(previous)
+        snapshot = copy.deepcopy(previous_output)
+        assert remap(previous, previous_output, input) == with_python.mapper(input)
+        assert previous_output == snapshot
+
+
+def test_removing_the_company_drops_the_status():
+    previous = generate("status", 1)[0]
+    input = {k: v for k, v in previous.items() if k != "CompanyCode"}
+    output = remap(previous, with_python.mapper(previous), input)
+    assert output == with_python.mapper(input)
+    assert "company" not in output["attributes"]
+
+
+def test_unchanged_subtrees_are_shared():
+    previous = generate("status", 1)[0]
+    previous_output = with_python.mapper(previous)
+    output = remap(previous, previous_output, {**previous, "EmploymentStatus": "X"})
+
+    assert output["metadata"] is previous_output["metadata"]
+    assert output["attributes"]["ids"] is previous_output["attributes"]["ids"]
+    company = output["attributes"]["company"][0]["value"]
+    previous_company = previous_output["attributes"]["company"][0]["value"]
+    assert company["status"] == [{"value": "X"}]
+    assert company["company_code"] is previous_company["company_code"]
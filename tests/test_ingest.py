@@ -0,0 +1,92 @@
+import json
+from pathlib import Path
+from typing import cast
+
+import pytest
+
+from mapping_sandbox import with_python
+from mapping_sandbox.bench.workloads import generate
+from mapping_sandbox.executor import Failure
+from mapping_sandbox.ingest import IngestStats, ingest, split
+
+
+@pytest.fixture
+def records() -> list[dict]:
+    return generate("mixed", 300)
+
+
+@pytest.fixture
+def jsonl(tmp_path: Path, records: list[dict]) -> Path:
+    path = tmp_path / "events.jsonl"
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+    return path
+
+
+def test_ranges_end_on_newlines(jsonl: Path):
+    data = jsonl.read_bytes()
+    ranges = list(split(jsonl, 1000))
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == len(data)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert data[end - 1 : end] == b"\n"
+
+
+def test_outputs_keep_file_order(jsonl: Path, records: list[dict]):
+    stats = IngestStats()
+    outputs = list(ingest(jsonl, with_python.mapper, 2, chunk_bytes=2000, stats=stats))
+    assert outputs == [with_python.mapper(record) for record in records]
+    assert stats.records == len(records)
+    assert stats.bytes == jsonl.stat().st_size
+    assert stats.finished is not None
+    assert stats.records_per_sec > 0
+
+
+def test_unordered_outputs_cover_every_record(jsonl: Path, records: list[dict]):
+    outputs = ingest(jsonl, with_python.mapper, 3, chunk_bytes=1500, ordered=False)
+    expected = [with_python.mapper(record) for record in records]
+    assert sorted(map(json.dumps, outputs)) == sorted(map(json.dumps, expected))
+
+
+def test_bad_lines_fail_alone(tmp_path: Path):
+    good, bad = generate("required", 2)
+    lines = [
+        json.dumps(good),
+        "",
+        "{not json",
+        json.dumps({k: v for k, v in bad.items() if k != "FirstName"}),
+    ]
+    path = tmp_path / "events.jsonl"
+    path.write_text("\n".join(lines))
+
+    outputs = list(ingest(path, with_python.mapper, workers=1))
+    assert len(outputs) == 3
+    assert outputs[0] == with_python.mapper(good)
+    assert isinstance(outputs[1], Failure)
+    assert outputs[1].record == {"line": "{not json"}
+    assert outputs[1].index == len(lines[0]) + 2
+    assert isinstance(outputs[2], Failure)
+    assert outputs[2].error.startswith("KeyError")
+
+
+def test_empty_file(tmp_path: Path):
+    path = tmp_path / "empty.jsonl"
+    path.touch()
+    assert list(ingest(path, with_python.mapper, workers=1)) == []
+
+
+def test_json_mappers_yield_bytes(jsonl: Path, records: list[dict]):
+    outputs = list(ingest(jsonl, with_python.map_to_json, 2, chunk_bytes=2000))
+    assert all(isinstance(o, bytes) for o in outputs)
+    assert [json.loads(cast(bytes, o)) for o in outputs] == [
+        with_python.mapper(record) for record in records
+    ]
+
+
+def test_stats_finish_when_closed_early(jsonl: Path):
+    stats = IngestStats()
+    outputs = ingest(jsonl, with_python.mapper, 1, chunk_bytes=2000, stats=stats)
+    next(outputs)
+    outputs.close()
+    assert stats.finished is not None
+    assert 0 < stats.records < 300
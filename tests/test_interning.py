@@ -0,0 +1,65 @@
+import tracemalloc
+
+from mapping_sandbox import with_python
+from mapping_sandbox.bench.workloads import generate
+from mapping_sandbox.interning import InternTable, interned, interned_many
+
+
+def test_outputs_are_unchanged():
+    records = generate("mixed", 100)
+    mapper = interned(with_python.mapper, InternTable())
+    assert [mapper(record) for record in records] == with_python.map_many(records)
+
+
+def test_repeated_values_are_shared():
+    first, second = generate("status", 2)
+    second = {**second, "CompanyCode": first["CompanyCode"]}
+    table = InternTable()
+    a, b = interned_many(with_python.map_many, table)([first, second])
+
+    company_a = a["attributes"]["company"][0]["value"]
+    company_b = b["attributes"]["company"][0]["value"]
+    assert company_a["company_code"] is company_b["company_code"]
+    assert company_a["type"] is company_b["type"]
+    assert a["attributes"]["config_flag"] is b["attributes"]["config_flag"]
+    assert a["metadata"][0]["type"] is b["metadata"][0]["type"]
+
+
+def test_stats_and_bounds():
+    table = InternTable(maxsize=2)
+    assert table.intern("a") == "a"
+    assert table.wrapped(False) == [{"value": False}]
+    assert table.wrapped(0) == [{"value": 0}]
+    assert table.wrapped(False) is table.wrapped(False)
+    info = table.info()
+    assert (info.size, info.hits, info.misses, info.overflows) == (2, 2, 2, 1)
+    assert info.hit_rate == 0.4
+    table.clear()
+    assert table.info().size == 0
+
+
+def test_unhashable_values_are_wrapped_unshared():
+    table = InternTable()
+    first, second = table.wrapped(["A", "B"]), table.wrapped(["A", "B"])
+    assert first == second == [{"value": ["A", "B"]}]
+    assert first is not second
+    assert table.info().size == 0
+
+    record = {**generate("company", 1)[0], "CompanyCode": {"code": "VOLKSFREI"}}
+    assert interned(with_python.mapper, table)(record) == with_python.mapper(record)
+
+
+def test_batches_take_less_memory():
+    records = generate("mixed", 2000)
+
+    def retained(map_many) -> int:
+        tracemalloc.start()
+        outputs = map_many(records)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del outputs
+        return size
+
+    plain = retained(with_python.map_many)
+    shared = retained(interned_many(with_python.map_many, InternTable()))
+    assert shared < 0.8 * plain
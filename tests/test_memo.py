@@ -0,0 +1,95 @@
+from datetime import datetime
+from typing import Any
+
+import pytest
+
+from mapping_sandbox import with_python
+from mapping_sandbox.bench.workloads import generate
+from mapping_sandbox.memo import CachedMapper, canonical_key
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_key_ignores_field_order():
+    input = generate("status", 1)[0]
+    assert canonical_key(input) == canonical_key(dict(reversed(input.items())))
+
+
+def test_inputs_that_are_not_plain_json_are_not_cached():
+    cached = CachedMapper(with_python.mapper)
+    string = generate("required", 1)[0]
+    stamp = {**string, "EventTimestamp": datetime(2023, 11, 2, 2, 15, 42)}
+    string["EventTimestamp"] = stamp["EventTimestamp"].isoformat()
+    assert canonical_key(stamp) is None
+    assert canonical_key({**string, "FirstName": ("John",)}) is None
+
+    assert cached(string) == with_python.mapper(string)
+    output = cached(stamp)
+    assert output["metadata"][0]["update_date"] == stamp["EventTimestamp"]
+    assert output == with_python.mapper(stamp)
+    info = cached.info()
+    assert (info.hits, info.misses, info.size) == (0, 2, 1)
+
+
+def test_hits_and_misses():
+    cached = CachedMapper(with_python.mapper)
+    input = generate("status", 1)[0]
+    assert cached(input) == cached(dict(input)) == with_python.mapper(input)
+    info = cached.info()
+    assert (info.hits, info.misses, info.size) == (1, 1, 1)
+
+
+def test_callers_cannot_poison_the_cache():
+    cached = CachedMapper(with_python.mapper)
+    input = generate("required", 1)[0]
+    cached(input)["attributes"]["first_name"] = "Poisoned"
+    hit = cached(input)
+    hit["attributes"]["ids"].clear()
+    assert cached(input) == with_python.mapper(input)
+
+
+def test_frozen_hits_are_shared_and_read_only():
+    cached = CachedMapper(with_python.mapper, frozen=True)
+    input = generate("required", 1)[0]
+    assert cached(input) is cached(input)
+    with pytest.raises(TypeError):
+        cached(input)["type"] = "foo/bar"
+
+
+def test_lru_eviction():
+    cached = CachedMapper(with_python.mapper, maxsize=2)
+    a, b, c = generate("required", 3)
+    cached(a)
+    cached(b)
+    cached(a)
+    cached(c)  # evicts b, the least recently used
+    cached(a)
+    info = cached.info()
+    assert (info.hits, info.evictions, info.size) == (2, 1, 2)
+    cached(b)
+    assert cached.info().misses == 4
+
+
+def test_ttl_expiry():
+    clock = Clock()
+    calls: list[dict[str, Any]] = []
+
+    def mapper(input: dict[str, Any]) -> dict[str, Any]:
+        calls.append(input)
+        return with_python.mapper(input)
+
+    cached = CachedMapper(mapper, ttl=10, clock=clock)
+    input = generate("required", 1)[0]
+    cached(input)
+    clock.now = 10
+    cached(input)
+    clock.now = 10.5
+    cached(input)
+    assert len(calls) == 2
+    assert cached.info().expirations == 1
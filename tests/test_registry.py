@@ -0,0 +1,34 @@
+import pytest
+
+from mapping_sandbox import registry
+
+
+def test_names_cover_every_entry():
+    assert registry.names() == sorted(registry.MAPPERS)
+    assert {"python", "pydantic_pipeline", "jinja"} <= set(registry.names())
+
+
+def test_unknown_names_are_reported():
+    with pytest.raises(KeyError, match="no mapper named"):
+        registry.get_mapper("cobol")
+
+
+def test_register_adds_a_mapper(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(registry, "MAPPERS", dict(registry.MAPPERS))
+    registry.register("alias", registry.Entry("mapping_sandbox.with_python"))
+    assert registry.get_mapper("alias") is registry.get_mapper("python")
+
+
+@pytest.mark.parametrize("name", ["python", "pipeline", "reduce", "spec"])
+def test_plain_python_mappers_stay_light(name: str):
+    # Generous: this guards against accidentally importing pydantic or
+    # jinja2 (or anything comparable), not against small regressions.
+    report = registry.check_import_budget(name, budget=0.5)
+    assert report.heavy == []
+
+
+def test_heavy_imports_are_reported():
+    report = registry.measure_import("mapping_sandbox.with_jinja")
+    assert report.heavy == ["jinja2"]
+    with pytest.raises(registry.ImportBudgetError):
+        registry.check_import_budget("jinja", budget=60)
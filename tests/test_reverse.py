@@ -0,0 +1,59 @@
+from typing import Any
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import builds, text
+from pydantic import ValidationError
+
+from mapping_sandbox import with_python
+from mapping_sandbox.bench.workloads import generate
+from mapping_sandbox.reverse import fast_unmapper, make_unmapper, unmap_many, unmapper
+from mapping_sandbox.schema import EmployeeIn
+
+
+def to_input(employee_in: EmployeeIn) -> dict[str, Any]:
+    return employee_in.model_dump(by_alias=True, exclude_none=True)
+
+
+@given(builds(EmployeeIn, CompanyCode=text()))
+def test_round_trip(employee_in: EmployeeIn):
+    input = to_input(employee_in)
+    output = with_python.mapper(input)
+    assert unmapper(output) == fast_unmapper(output) == input
+
+
+def test_company_block_is_optional():
+    for record in generate("mixed", 30):
+        assert fast_unmapper(with_python.mapper(record)) == record
+
+
+def test_validation_rejects_malformed_documents():
+    output = with_python.mapper(generate("required", 1)[0])
+    del output["attributes"]["ids"]
+    with pytest.raises(ValidationError):
+        unmapper(output)
+
+
+def test_unmap_many_extracts_selected_fields_lazily():
+    records = generate("status", 5)
+    outputs = (with_python.mapper(record) for record in records)
+    unmapped = unmap_many(outputs, fields=["EmployeeNumber", "EmploymentStatus"])
+    assert next(unmapped) == {
+        "EmployeeNumber": records[0]["EmployeeNumber"],
+        "EmploymentStatus": records[0]["EmploymentStatus"],
+    }
+    assert len(list(unmapped)) == 4
+
+
+def test_unmap_many_can_validate():
+    records = generate("company", 5)
+    outputs = [with_python.mapper(record) for record in records]
+    assert list(unmap_many(outputs, validate=True)) == records
+    with pytest.raises(ValueError):
+        unmap_many(outputs, fields=["FirstName"], validate=True)
+
+
+def test_no_fields_means_none():
+    output = with_python.mapper(generate("status", 1)[0])
+    assert make_unmapper([])(output) == {}
+    assert list(unmap_many([output], fields=[])) == [{}]
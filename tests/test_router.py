@@ -0,0 +1,78 @@
+from typing import Any
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from mapping_sandbox import with_python, with_reduce
+from mapping_sandbox.bench.workloads import generate
+from mapping_sandbox.router import FieldRouter
+
+
+def record(**extra: Any) -> dict[str, Any]:
+    return {**generate("required", 1)[0], **extra}
+
+
+def test_dependent_fields_in_any_order():
+    status_first = {
+        "EmploymentStatus": "TERMINATED",
+        **record(),
+        "CompanyCode": "VOLKSFREI",
+    }
+    assert list(status_first)[0] == "EmploymentStatus"
+    assert with_reduce.mapper(status_first) == with_python.mapper(status_first)
+    assert with_reduce.map_many([status_first]) == [with_python.mapper(status_first)]
+
+
+def test_dependent_fields_are_dropped_without_their_requirement():
+    input = record(EmploymentStatus="ACTIVE")
+    assert with_reduce.mapper(input) == with_python.mapper(input)
+
+
+@given(st.permutations(sorted(record(CompanyCode="X", EmploymentStatus="Y").items())))
+def test_key_order_never_matters(items: list[tuple[str, Any]]):
+    input = dict(items)
+    assert with_reduce.mapper(input) == with_python.mapper(input)
+
+
+def test_unknown_keys_are_ignored():
+    wide = record(CompanyCode="NAKATOMI", **{f"Unmapped{i}": i for i in range(300)})
+    assert with_reduce.mapper(wide) == with_python.mapper(wide)
+    assert with_reduce.router.unknown(wide) == {f"Unmapped{i}" for i in range(300)}
+
+
+def test_routes_in_dependency_order():
+    seen: list[str] = []
+
+    def handler(name: str):
+        return lambda *_: seen.append(name)
+
+    router = FieldRouter(
+        {"c": handler("c"), "b": handler("b"), "a": handler("a")},
+        requires={"c": "b", "b": "a"},
+    )
+    assert router.route({}, {"c": 1, "b": 2, "a": 3, "z": 4}) == {}
+    assert seen == ["a", "b", "c"]
+    assert list(router.items({"c": 1, "a": 3})) == [("a", 3)]
+
+
+def test_chained_requirements():
+    router = FieldRouter(
+        {"c": print, "b": print, "a": print}, requires={"c": "b", "b": "a"}
+    )
+    assert list(router.items({"c": 1, "b": 2})) == []
+    assert list(router.items({"c": 1, "a": 3})) == [("a", 3)]
+    seen: list[str] = []
+    router = FieldRouter(
+        {key: lambda _, value: seen.append(value) for key in "abc"},
+        requires={"c": "b", "b": "a"},
+    )
+    router.route({}, {"c": "c", "b": "b"})
+    assert seen == []
+
+
+def test_bad_requirements():
+    with pytest.raises(ValueError, match="no handler"):
+        FieldRouter({"a": print}, requires={"a": "b"})
+    with pytest.raises(ValueError, match="circular"):
+        FieldRouter({"a": print, "b": print}, requires={"a": "b", "b": "a"})
@@ -0,0 +1,65 @@
+import pytest
+
+from mapping_sandbox import registry, selector
+from mapping_sandbox.bench.workloads import generate
+from mapping_sandbox.conformance import REFERENCE_CASES, conforms
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MAPPING_SANDBOX_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_every_registered_mapper_conforms():
+    assert all(conforms(registry.get_mapper(name)) for name in registry.names())
+
+
+def test_wrong_mappers_are_rejected(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(registry, "MAPPERS", dict(registry.MAPPERS))
+    registry.register("broken", registry.Entry("mapping_sandbox.reverse", "unmapper"))
+    selection = selector.select_mapper(generate("mixed", 20), ["python", "broken"])
+    assert selection.name == "python"
+    assert selection.rejected == ["broken"]
+
+
+def test_selection_is_cached():
+    sample = generate("mixed", 50)
+    first = selector.select_mapper(sample, ["python", "spec"], repeat=1)
+    assert first.name in ("python", "spec")
+    assert not first.cached
+
+    again = selector.select_mapper(sample, ["spec", "python"], repeat=1)
+    assert again.cached
+    assert again.name == first.name
+
+
+def test_corrupt_cache_entries_are_misses(cache_dir):
+    sample = generate("mixed", 50)
+    selector.select_mapper(sample, ["python"], repeat=1)
+    (entry,) = (cache_dir / "selector").glob("*.json")
+    entry.write_text(entry.read_text()[:10])
+
+    selection = selector.select_mapper(sample, ["python"], repeat=1)
+    assert not selection.cached
+    assert selector.select_mapper(sample, ["python"], repeat=1).cached
+
+
+def test_unwritable_caches_are_ignored(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    blocker = tmp_path / "file"
+    blocker.touch()
+    monkeypatch.setenv("MAPPING_SANDBOX_CACHE_DIR", str(blocker))
+    selection = selector.select_mapper(generate("mixed", 20), ["python"], repeat=1)
+    assert selection.name == "python"
+
+
+def test_cache_is_keyed_on_workload_shape():
+    sparse = selector.cache_key(["python"], generate("required", 50))
+    dense = selector.cache_key(["python"], generate("status", 50))
+    assert sparse != dense
+
+
+def test_reference_cases_are_not_mutated():
+    before = repr(REFERENCE_CASES)
+    selector.select_mapper(generate("mixed", 10), ["python"], use_cache=False)
+    assert repr(REFERENCE_CASES) == before
@@ -0,0 +1,133 @@
+import asyncio
+import json
+import signal
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable
+
+import pytest
+
+from mapping_sandbox import with_python
+from mapping_sandbox.bench.workloads import generate
+from mapping_sandbox.server import Batcher, Server, connect, map_remote
+
+
+@pytest.fixture(scope="module")
+def server(tmp_path_factory: pytest.TempPathFactory):
+    path = tmp_path_factory.mktemp("server") / "mapper.sock"
+    with Server("pydantic_fast", str(path), workers=2, max_batch=16) as server:
+        yield server
+    assert not path.exists()
+
+
+def test_maps_over_a_unix_socket(server: Server):
+    records = generate("mixed", 100)
+    assert map_remote(server.address, records, chunk_size=30) == with_python.map_many(
+        records
+    )
+
+
+def test_concurrent_clients(server: Server):
+    batches = [generate("mixed", 50, seed=seed) for seed in range(6)]
+    with ThreadPoolExecutor(6) as pool:
+        results = list(pool.map(lambda b: map_remote(server.address, b), batches))
+    assert results == [with_python.map_many(batch) for batch in batches]
+
+
+def test_bad_inputs_fail_alone(server: Server):
+    good = generate("required", 2)
+    with connect(server.address) as sock, sock.makefile("rb") as responses:
+        lines = [
+            json.dumps(good[0]),
+            "{oops",
+            json.dumps({"FirstName": "Al"}),
+            json.dumps(good[1]),
+        ]
+        sock.sendall("\n".join(lines).encode() + b"\n")
+        replies = [json.loads(responses.readline()) for _ in lines]
+    assert replies[0] == with_python.mapper(good[0])
+    assert replies[1]["error"].startswith("JSONDecodeError")
+    assert replies[2]["error"].startswith("ValidationError")
+    assert replies[3] == with_python.mapper(good[1])
+
+
+def test_tcp():
+    records = generate("status", 10)
+    with Server("python") as server:
+        host, port = server.address
+        assert port
+        assert map_remote((host, port), records) == with_python.map_many(records)
+
+
+def test_batches_by_size_and_time():
+    async def run() -> tuple[list[bytes], int]:
+        batcher = Batcher("python", max_batch=4, max_delay=0.01)
+        lines = [json.dumps(r).encode() for r in generate("mixed", 10)]
+        futures = [batcher.submit(line) for line in lines]
+        assert batcher.batches == 2
+        return list(await asyncio.gather(*futures)), batcher.batches
+
+    responses, batches = asyncio.run(run())
+    assert batches == 3
+    assert [json.loads(r) for r in responses] == with_python.map_many(
+        generate("mixed", 10)
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"max_batch": 0}, {"max_delay": -0.001}],
+)
+def test_bad_batching_is_rejected(kwargs: dict[str, Any]):
+    with pytest.raises(ValueError):
+        Batcher("python", **kwargs)
+    with pytest.raises(ValueError):
+        Server(**kwargs)
+
+
+def test_bad_worker_counts_are_rejected():
+    with pytest.raises(ValueError, match="workers"):
+        Server(workers=0)
+
+
+def test_bad_records_stay_out_of_the_batch():
+    good = generate("mixed", 6)
+    records = [*good[:3], {"FirstName": "Al"}, *good[3:]]
+    mapped: list[Any] = []
+
+    async def run() -> list[bytes]:
+        batcher = Batcher("python", max_batch=len(records))
+
+        def map_many(batch: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+            batch = list(batch)
+            mapped.extend(batch)
+            return with_python.map_many(batch)
+
+        batcher.map_many = map_many
+        futures = [batcher.submit(json.dumps(r).encode()) for r in records]
+        return list(await asyncio.gather(*futures))
+
+    responses = [json.loads(r) for r in asyncio.run(run())]
+    assert mapped == good
+    assert responses[3]["error"].startswith("KeyError")
+    del responses[3]
+    assert responses == with_python.map_many(good)
+
+
+def test_main_serves_until_interrupted(tmp_path: Path):
+    path = tmp_path / "main.sock"
+    args = ["-m", "mapping_sandbox.server", "-s", str(path), "-w", "1"]
+    with subprocess.Popen(
+        [sys.executable, *args], stdout=subprocess.PIPE, text=True
+    ) as process:
+        try:
+            assert process.stdout is not None
+            assert str(path) in process.stdout.readline()
+            records = generate("mixed", 20)
+            assert map_remote(str(path), records) == with_python.map_many(records)
+        finally:
+            process.send_signal(signal.SIGINT)
+        assert process.wait(timeout=10) == 0
+    assert not path.exists()
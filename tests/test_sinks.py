@@ -0,0 +1,128 @@
+import asyncio
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from mapping_sandbox import sinks, with_python, with_spec
+from mapping_sandbox.bench.workloads import generate
+from mapping_sandbox.sinks import FileSink, employee_id
+from mapping_sandbox.streaming import stream
+
+
+@pytest.fixture
+def outputs() -> list[dict]:
+    return with_python.map_many(generate("mixed", 200))
+
+
+def canonical(documents) -> list[str]:
+    return sorted(json.dumps(document, sort_keys=True) for document in documents)
+
+
+def read(paths: list[Path]) -> list[dict]:
+    lines: list[str] = []
+    for path in paths:
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "rt") as f:
+            lines.extend(f)
+    return [json.loads(line) for line in lines]
+
+
+def test_writes_json_lines(tmp_path: Path, outputs: list[dict]):
+    with FileSink(tmp_path, buffer_size=100) as sink:
+        sink.write_many(outputs)
+    assert [p.name for p in sink.paths] == [f"employees-000-0000-{sink.token}.jsonl"]
+    assert read(sink.paths) == outputs
+
+
+def test_nothing_is_visible_until_committed(tmp_path: Path, outputs: list[dict]):
+    sink = FileSink(tmp_path, buffer_size=100)
+    sink.write_many(outputs)
+    assert list(tmp_path.glob("*.jsonl")) == []
+    sink.close()
+    assert list(tmp_path.glob("*.jsonl")) == sink.paths
+    assert list(tmp_path.glob(".*.tmp")) == []
+
+
+def test_failures_leave_no_files_behind(tmp_path: Path, outputs: list[dict]):
+    with pytest.raises(RuntimeError), FileSink(tmp_path) as sink:
+        sink.write_many(outputs)
+        raise RuntimeError
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_partitions_by_employee_id(tmp_path: Path, outputs: list[dict]):
+    with FileSink(tmp_path, partitions=4) as sink:
+        sink.write_many(outputs)
+    assert len(sink.paths) == 4
+    seen: dict[str, Path] = {}
+    for path in sink.paths:
+        for output in read([path]):
+            assert seen.setdefault(employee_id(output), path) == path
+    assert sorted(map(json.dumps, read(sink.paths))) == sorted(map(json.dumps, outputs))
+
+
+def test_rolls_over_by_size(tmp_path: Path, outputs: list[dict]):
+    with FileSink(tmp_path, max_bytes=10_000) as sink:
+        sink.write_many(outputs)
+    assert len(sink.paths) > 1
+    assert all(path.stat().st_size < 10_000 + 1000 for path in sink.paths)
+    assert read(sink.paths) == outputs
+
+
+def test_sinks_sharing_a_directory_keep_their_own_files(
+    tmp_path: Path, outputs: list[dict]
+):
+    with FileSink(tmp_path) as first, FileSink(tmp_path) as second:
+        first.write_many(outputs[:100])
+        second.write_many(outputs[100:])
+    assert set(tmp_path.iterdir()) == {*first.paths, *second.paths}
+    assert read(first.paths) + read(second.paths) == outputs
+
+
+def test_gzip_and_json_bytes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    records = generate("status", 50)
+    monkeypatch.setattr(sinks, "employee_id", None)  # partitioned on the inputs
+    with FileSink(tmp_path, partitions=2, compression="gzip") as sink:
+        sink.write_many(map(with_spec.map_to_json, records), records)
+    assert all(path.name.endswith(".jsonl.gz") for path in sink.paths)
+    assert canonical(read(sink.paths)) == canonical(with_python.map_many(records))
+
+
+def test_inputs_must_line_up_with_outputs(tmp_path: Path):
+    records = generate("required", 5)
+    with FileSink(tmp_path, partitions=2) as sink:
+        with pytest.raises(ValueError):
+            sink.write_many(with_python.map_many(records[1:]), records)
+        with pytest.raises(ValueError):
+            sink.write_many(with_python.map_many(records), records[1:])
+
+
+def test_compression_level_zero_is_kept(tmp_path: Path, outputs: list[dict]):
+    sizes = {}
+    for level in (0, 6):
+        with FileSink(tmp_path / str(level), compression="gzip", level=level) as sink:
+            sink.write_many(outputs)
+        (path,) = sink.paths
+        sizes[level] = path.stat().st_size
+        assert read(sink.paths) == outputs
+    assert sizes[0] > 2 * sizes[6]
+
+
+def test_unknown_compression(tmp_path: Path):
+    with pytest.raises(ValueError):
+        FileSink(tmp_path, compression="lzma")
+
+
+def test_streaming_into_a_sink(tmp_path: Path):
+    records = generate("mixed", 30)
+
+    async def source():
+        for record in records:
+            yield record
+
+    with FileSink(tmp_path) as sink:
+        count = asyncio.run(stream(source(), with_python.mapper, sink.as_async(), 1))
+    assert count == 30
+    assert read(sink.paths) == with_python.map_many(records)
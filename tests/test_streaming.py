@@ -0,0 +1,90 @@
+import asyncio
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from mapping_sandbox import with_python
+from mapping_sandbox.bench.workloads import generate
+from mapping_sandbox.streaming import stream
+
+
+async def from_list(records: list[dict[str, Any]]) -> AsyncIterator[dict[str, Any]]:
+    for record in records:
+        yield record
+
+
+def test_single_worker_preserves_order():
+    records = generate("mixed", 50)
+    received: list[dict[str, Any]] = []
+
+    async def sink(output: dict[str, Any]) -> None:
+        received.append(output)
+
+    count = asyncio.run(stream(from_list(records), with_python.mapper, sink, workers=1))
+    assert count == 50
+    assert received == [with_python.mapper(record) for record in records]
+
+
+def test_slow_sink_throttles_source():
+    records = generate("required", 200)
+    produced = 0
+    delivered = 0
+    most_in_flight = 0
+
+    async def source() -> AsyncIterator[dict[str, Any]]:
+        nonlocal produced, most_in_flight
+        for record in records:
+            produced += 1
+            most_in_flight = max(most_in_flight, produced - delivered)
+            yield record
+
+    async def sink(_: dict[str, Any]) -> None:
+        nonlocal delivered
+        await asyncio.sleep(0)
+        delivered += 1
+
+    asyncio.run(stream(source(), with_python.mapper, sink, workers=3, maxsize=5))
+    assert delivered == 200
+    # Two full queues, one record per worker, and one held by the producer.
+    assert most_in_flight <= 5 + 5 + 3 + 2
+
+
+def test_offloads_to_executor():
+    records = generate("status", 20)
+    received: list[dict[str, Any]] = []
+
+    async def sink(output: dict[str, Any]) -> None:
+        received.append(output)
+
+    with ThreadPoolExecutor(2) as executor:
+        asyncio.run(
+            stream(from_list(records), with_python.mapper, sink, executor=executor)
+        )
+
+    def update_date(output: dict[str, Any]) -> str:
+        return output["metadata"][0]["update_date"]
+
+    expected = [with_python.mapper(record) for record in records]
+    assert sorted(received, key=update_date) == sorted(expected, key=update_date)
+
+
+def test_mapping_errors_propagate():
+    records = generate("required", 10)
+    records[3] = {k: v for k, v in records[3].items() if k != "FirstName"}
+
+    async def sink(_: dict[str, Any]) -> None:
+        pass
+
+    with pytest.raises(KeyError):
+        asyncio.run(stream(from_list(records), with_python.mapper, sink))
+
+
+@pytest.mark.parametrize("options", [{"workers": 0}, {"maxsize": 0}])
+def test_rejects_empty_pipelines(options: dict[str, Any]):
+    async def sink(_: dict[str, Any]) -> None:
+        pass
+
+    with pytest.raises(ValueError):
+        asyncio.run(stream(from_list([]), with_python.mapper, sink, **options))
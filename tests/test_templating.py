@@ -0,0 +1,73 @@
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from mapping_sandbox import templating
+
+
+@pytest.fixture(autouse=True)
+def fresh_engine(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setenv("MAPPING_SANDBOX_CACHE_DIR", str(tmp_path))
+    templating.clear()
+    yield
+    templating.clear()
+
+
+def test_templates_are_compiled_once():
+    assert templating.get_template("employee.json") is templating.get_template(
+        "employee.json"
+    )
+
+
+def test_bytecode_is_cached_on_disk(tmp_path: Path):
+    templating.get_template("employee.json")
+    assert list((tmp_path / "jinja").glob("*.cache"))
+
+
+def test_stale_templates_are_detected_and_reloaded():
+    assert not templating.is_stale("employee.json")
+    template = templating.get_template("employee.json")
+    assert template.filename is not None
+    path = Path(template.filename)
+    mtime = path.stat().st_mtime
+    try:
+        os.utime(path, (mtime + 10, mtime + 10))
+        assert templating.is_stale("employee.json")
+        assert templating.reload("employee.json") is not template
+        assert not templating.is_stale("employee.json")
+    finally:
+        os.utime(path, (mtime, mtime))
+
+
+def test_unwritable_caches_are_ignored(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    blocker = tmp_path / "file"
+    blocker.touch()
+    monkeypatch.setenv("MAPPING_SANDBOX_CACHE_DIR", str(blocker))
+    assert templating.environment().bytecode_cache is None
+    assert (
+        templating.get_template("employee.json")
+        .render(EmployeeNumber="1")
+        .startswith("{")
+    )
+
+
+def test_render_batch_is_one_json_array():
+    records = [
+        {
+            "EventTimestamp": "2023-11-02T02:15:42.847038",
+            "EmployeeNumber": str(n),
+            "FirstName": "John",
+            "LastName": "McClane",
+        }
+        for n in range(3)
+    ]
+    rendered = templating.render_batch("employee.json", records)
+    assert [doc["metadata"][0]["value"] for doc in json.loads(rendered)] == [
+        "0",
+        "1",
+        "2",
+    ]
+    assert templating.map_batch("employee.json", []) == []
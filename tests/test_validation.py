@@ -0,0 +1,90 @@
+from typing import Any
+
+from hypothesis import given
+from hypothesis import strategies as st
+from pydantic import ValidationError
+
+from mapping_sandbox import with_python, with_reduce
+from mapping_sandbox.bench.workloads import generate
+from mapping_sandbox.schema import EmployeeIn
+from mapping_sandbox.validation import (
+    MISSING,
+    NOT_AN_OBJECT,
+    STATUS_WITHOUT_COMPANY,
+    WRONG_TYPE,
+    Reason,
+    Validator,
+    check,
+)
+from mapping_sandbox.with_pydantic_fast import trusted_map_many
+
+KEYS = [
+    "EventTimestamp",
+    "EmployeeNumber",
+    "FirstName",
+    "LastName",
+    "CompanyCode",
+    "EmploymentStatus",
+]
+
+values = st.one_of(st.text(max_size=5), st.none(), st.integers(), st.booleans())
+
+
+@given(st.dictionaries(st.sampled_from(KEYS), values))
+def test_checked_records_pass_schema_validation(record: dict[str, Any]):
+    try:
+        EmployeeIn.model_validate(record)
+    except ValidationError:
+        assert check(record)
+    else:
+        reasons = check(record)
+        assert reasons in ([], [Reason(STATUS_WITHOUT_COMPANY, "EmploymentStatus")])
+
+
+def test_reasons():
+    good = generate("required", 1)[0]
+    assert check(good) == []
+    assert check([good]) == [Reason(NOT_AN_OBJECT)]
+    assert check({**good, "FirstName": 7, "CompanyCode": None}) == [
+        Reason(WRONG_TYPE, "FirstName")
+    ]
+    missing = {k: v for k, v in good.items() if k != "LastName"}
+    assert check({**missing, "EmploymentStatus": "ACTIVE"}) == [
+        Reason(MISSING, "LastName"),
+        Reason(STATUS_WITHOUT_COMPANY, "EmploymentStatus"),
+    ]
+
+
+def test_bad_records_never_reach_the_mapper():
+    records: list[Any] = generate("mixed", 100)
+    records[10] = {**records[10], "EmploymentStatus": "ACTIVE", "CompanyCode": None}
+    records[20] = {k: v for k, v in records[20].items() if k != "EmployeeNumber"}
+    records[30] = "not a record"
+
+    validator = Validator()
+    outputs = validator.map_many(with_reduce.mapper, records)
+    assert len(outputs) == 97
+    assert [r.index for r in validator.dead_letters] == [10, 20, 30]
+    assert validator.error_rate == 0.03
+    assert validator.error_rates() == {
+        STATUS_WITHOUT_COMPANY: 0.01,
+        MISSING: 0.01,
+        NOT_AN_OBJECT: 0.01,
+    }
+
+
+def test_wraps_trusted_batch_mappers():
+    records = generate("status", 20)
+    validator = Validator()
+    map_many = validator.wrap(trusted_map_many)
+    assert map_many(records + [{}]) == with_python.map_many(records)
+    assert map_many(records[:5]) == with_python.map_many(records[:5])
+    assert validator.checked == 26
+    assert [r.index for r in validator.dead_letters] == [20]
+
+
+def test_dead_letters_are_bounded():
+    validator = Validator(max_dead_letters=2)
+    validator.split([{}, {}, {}])
+    assert [r.index for r in validator.dead_letters] == [1, 2]
+    assert validator.rejected == 3
@@ -0,0 +1,49 @@
+from typing import Any
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import builds, text
+from pydantic import ValidationError
+
+from mapping_sandbox import with_python
+from mapping_sandbox.schema import EmployeeIn, EmployeeOut
+from mapping_sandbox.with_pydantic_fast import (
+    make_batch_mapper,
+    make_mapper,
+    mapper,
+    trusted_mapper,
+)
+
+
+def to_input(employee_in: EmployeeIn) -> dict[str, Any]:
+    return employee_in.model_dump(by_alias=True, exclude_none=True)
+
+
+@given(builds(EmployeeIn, CompanyCode=text(), EmploymentStatus=text()))
+def test_output_conforms_to_employee_out(employee_in: EmployeeIn):
+    output = mapper(to_input(employee_in))
+    assert EmployeeOut.model_validate(output).model_dump(exclude_none=True) == output
+
+
+@given(builds(EmployeeIn))
+def test_trusted_mapper_matches_mapper(employee_in: EmployeeIn):
+    input = to_input(employee_in)
+    assert trusted_mapper(input) == mapper(input) == with_python.mapper(input)
+
+
+def test_input_is_validated_unless_trusted():
+    input = {
+        "EventTimestamp": "2023-11-02T02:15:42.847038",
+        "EmployeeNumber": 12345,
+        "FirstName": "John",
+        "LastName": "McClane",
+    }
+    with pytest.raises(ValidationError):
+        mapper(input)
+    assert trusted_mapper(input)["metadata"][0]["value"] == 12345
+
+
+def test_mode_is_switchable():
+    assert make_mapper() is mapper
+    assert make_mapper(trusted=True) is trusted_mapper
+    assert make_batch_mapper(trusted=True)([]) == []